@@ -4,6 +4,7 @@ import tomllib
 from pathlib import Path
 
 from statsvy.data.project_info import (
+    EMPTY_PROJECT_FILE_INFO,
     Dependency,
     DependencyInfo,
     ProjectFileInfo,
@@ -35,7 +36,7 @@ class CargoTomlReader:
             data = tomllib.load(f)
 
         if not isinstance(data, dict):
-            return ProjectFileInfo(name=None, dependencies=None, source_files=())
+            return EMPTY_PROJECT_FILE_INFO
 
         # Extract project name
         name: str | None = None
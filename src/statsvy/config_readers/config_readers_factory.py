@@ -4,7 +4,10 @@ This module provides factory functions to create appropriate reader
 instances based on configuration file paths.
 """
 
+import sys
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 
 from statsvy.config_readers.cargo_toml_reader import CargoTomlReader
 from statsvy.config_readers.package_json_reader import PackageJsonReader
@@ -12,6 +15,29 @@ from statsvy.config_readers.project_config_reader import ProjectConfigReader
 from statsvy.config_readers.pyproject_reader import PyProjectReader
 from statsvy.config_readers.requirements_txt_reader import RequirementsTxtReader
 
+# Readers are stateless, so one shared instance per file name is enough.
+# Keys are interned to match the scanner's candidate names.
+_READERS: Mapping[str, ProjectConfigReader] = MappingProxyType(
+    {
+        sys.intern("pyproject.toml"): PyProjectReader(),
+        sys.intern("package.json"): PackageJsonReader(),
+        sys.intern("Cargo.toml"): CargoTomlReader(),
+        sys.intern("requirements.txt"): RequirementsTxtReader(),
+    }
+)
+
+
+def get_reader_for_name(file_name: str) -> ProjectConfigReader | None:
+    """Get the appropriate config reader for a file name.
+
+    Args:
+        file_name: Base name of the configuration file (e.g. "package.json").
+
+    Returns:
+        Shared reader instance, or None if file type is not supported.
+    """
+    return _READERS.get(file_name)
+
 
 def get_reader_for_file(file_path: Path) -> ProjectConfigReader | None:
     """Get the appropriate config reader for a file.
@@ -22,12 +48,4 @@ def get_reader_for_file(file_path: Path) -> ProjectConfigReader | None:
     Returns:
         Appropriate reader instance, or None if file type is not supported.
     """
-    if file_path.name == "pyproject.toml":
-        return PyProjectReader()
-    elif file_path.name == "package.json":
-        return PackageJsonReader()
-    elif file_path.name == "Cargo.toml":
-        return CargoTomlReader()
-    elif file_path.name == "requirements.txt":
-        return RequirementsTxtReader()
-    return None
+    return get_reader_for_name(file_path.name)
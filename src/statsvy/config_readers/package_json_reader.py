@@ -4,6 +4,7 @@ import json
 from pathlib import Path
 
 from statsvy.data.project_info import (
+    EMPTY_PROJECT_FILE_INFO,
     Dependency,
     DependencyInfo,
     ProjectFileInfo,
@@ -30,11 +31,12 @@ class PackageJsonReader:
             FileNotFoundError: If file does not exist.
             json.JSONDecodeError: If JSON file is malformed.
         """
-        with open(path, encoding="utf-8") as f:
-            data = json.load(f)
+        # json.loads detects the UTF encoding of raw bytes itself, which
+        # skips the text-mode decoding layer of a regular file object.
+        data = json.loads(path.read_bytes())
 
         if not isinstance(data, dict):
-            return ProjectFileInfo(name=None, dependencies=None, source_files=())
+            return EMPTY_PROJECT_FILE_INFO
 
         # Extract project name
         name: str | None = None
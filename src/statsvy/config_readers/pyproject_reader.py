@@ -5,11 +5,15 @@ import tomllib
 from pathlib import Path
 
 from statsvy.data.project_info import (
+    EMPTY_PROJECT_FILE_INFO,
     Dependency,
     DependencyInfo,
     ProjectFileInfo,
 )
 
+# PEP 508 name, optional [extras], then the raw version specifier
+_DEPENDENCY_PATTERN = re.compile(r"^([a-zA-Z0-9._-]+)(\[[^\]]*\])?(.*?)$")
+
 
 class PyProjectReader:
     """Reads project information from pyproject.toml files.
@@ -35,7 +39,7 @@ class PyProjectReader:
             data = tomllib.load(f)
 
         if not isinstance(data, dict):
-            return ProjectFileInfo(name=None, dependencies=None, source_files=())
+            return EMPTY_PROJECT_FILE_INFO
 
         project_section = data.get("project")
         # Some malformed/legacy pyproject files use a *literal* table name
@@ -47,7 +51,7 @@ class PyProjectReader:
             if isinstance(alt, dict):
                 project_section = alt
             else:
-                return ProjectFileInfo(name=None, dependencies=None, source_files=())
+                return EMPTY_PROJECT_FILE_INFO
 
         # Extract project name and dependencies
         name = self._get_project_name(project_section)
@@ -192,7 +196,7 @@ class PyProjectReader:
 
         # Extract name and version using regex
         # Matches: name (with optional [extras]) optionally followed by version spec
-        match = re.match(r"^([a-zA-Z0-9._-]+)(\[[^\]]*\])?(.*?)$", dep_str.strip())
+        match = _DEPENDENCY_PATTERN.match(dep_str.strip())
 
         if not match:
             return None
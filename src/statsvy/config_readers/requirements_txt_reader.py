@@ -1,5 +1,6 @@
 """Requirements.txt configuration reader."""
 
+import re
 from pathlib import Path
 
 from statsvy.data.project_info import (
@@ -8,6 +9,27 @@ from statsvy.data.project_info import (
     ProjectFileInfo,
 )
 
+# One requirement per line: name, optional [extras], optional version
+# specifier or PEP 508 direct reference ("name @ url"), optional environment
+# marker and optional trailing comment.
+# Blank lines, comment lines and pip options ("-r", "-e", "--index-url")
+# do not match and are skipped.
+_REQUIREMENT_PATTERN = re.compile(
+    r"""
+    ^[ \t]*
+    (?P<name>[^\s\#<>=!~\[;-][^\s\#<>=!~\[;]*)
+    [ \t]*(?:\[[^\]\n]*\])?
+    (?:[ \t]*(?P<op>===|==|>=|<=|~=|!=|>|<|@)[ \t]*(?P<version>[^\#;\n]*?))?
+    [ \t]*(?:;[^\#\n]*)?
+    (?:\#[^\n]*)?$
+    """,
+    re.MULTILINE | re.VERBOSE,
+)
+
+# Files above this size are streamed line by line instead of read whole
+_STREAM_THRESHOLD_BYTES = 1024 * 1024
+_READ_BUFFER_SIZE = 64 * 1024
+
 
 class RequirementsTxtReader:
     """Reads dependency information from requirements.txt files.
@@ -29,27 +51,11 @@ class RequirementsTxtReader:
         Raises:
             FileNotFoundError: If file does not exist.
         """
-        dependencies_list: list[Dependency] = []
-
-        with open(path, encoding="utf-8") as f:
-            for line in f:
-                cleaned_line = line.strip()
-
-                # Skip empty lines and comments
-                if not cleaned_line or cleaned_line.startswith("#"):
-                    continue
-
-                # Remove inline comments
-                if "#" in cleaned_line:
-                    cleaned_line = cleaned_line.split("#")[0].strip()
-
-                if not cleaned_line:
-                    continue
-
-                # Parse dependency line
-                dep = self._parse_requirement_line(cleaned_line)
-                if dep:
-                    dependencies_list.append(dep)
+        if path.stat().st_size > _STREAM_THRESHOLD_BYTES:
+            dependencies_list = self._parse_requirements_stream(path)
+        else:
+            text = path.read_text(encoding="utf-8")
+            dependencies_list = self._parse_requirements(text)
 
         # Create DependencyInfo if we found dependencies
         dep_info: DependencyInfo | None = None
@@ -74,52 +80,80 @@ class RequirementsTxtReader:
         )
 
     @staticmethod
-    def _parse_requirement_line(line: str) -> Dependency | None:
-        """Parse a single requirements.txt line into a Dependency.
+    def _parse_requirements(text: str) -> list[Dependency]:
+        """Parse the full contents of a requirements.txt file.
+
+        Runs a single precompiled multi-line regex over the whole text, so the
+        per-line matching loop happens inside the ``re`` engine.
 
         Handles formats like:
         - "click"
         - "click==8.0.0"
         - "click>=8.0.0,<9.0.0"
         - "click[extra]==8.0.0"
+        - "click>=8.0.0  # inline comment"
+        - "click @ https://example.com/click-8.0.0-py3-none-any.whl"
 
         Args:
-            line: Single requirement line.
+            text: Contents of a requirements.txt file.
 
         Returns:
-            Dependency object if parsed successfully, None otherwise.
+            List of Dependency objects, in file order.
         """
-        if not line:
-            return None
-
-        # Remove extras (parts in brackets)
-        if "[" in line:
-            line = (
-                line.split("[", maxsplit=1)[0] + line.split("]", 1)[1]
-                if "]" in line
-                else line
-            )
-            line = line.replace("]", "")
-
-        # Extract name and version
-        # Operators: ==, >=, <=, >, <, ~=, !=
-        for op in ("==", ">=", "<=", "~=", ">", "<", "!="):
-            if op in line:
-                parts = line.split(op, 1)
-                name = parts[0].strip()
-                version = op + parts[1].strip() if parts[1] else op
-
-                return Dependency(
-                    name=name.lower(),
-                    version=version,
-                    category="prod",
-                    source_file="requirements.txt",
-                )
-
-        # No version specification
+        return [
+            RequirementsTxtReader._make_dependency(name, op, version)
+            for name, op, version in _REQUIREMENT_PATTERN.findall(text)
+        ]
+
+    @staticmethod
+    def _parse_requirements_stream(path: Path) -> list[Dependency]:
+        """Parse a large requirements.txt file without loading it whole.
+
+        Reads through a 64 KiB buffer and only decodes lines that are not
+        blank or comments.
+
+        Args:
+            path: Path to requirements.txt file.
+
+        Returns:
+            List of Dependency objects, in file order.
+        """
+        dependencies_list: list[Dependency] = []
+        with path.open("rb", buffering=_READ_BUFFER_SIZE) as f:
+            for raw in f:
+                raw_line = raw.strip()
+                if not raw_line or raw_line.startswith(b"#"):
+                    continue
+                match = _REQUIREMENT_PATTERN.match(raw_line.decode("utf-8"))
+                if match:
+                    dependencies_list.append(
+                        RequirementsTxtReader._make_dependency(*match.groups())
+                    )
+        return dependencies_list
+
+    @staticmethod
+    def _make_dependency(name: str, op: str | None, version: str | None) -> Dependency:
+        """Build a Dependency from the groups of a requirement match.
+
+        Args:
+            name: Package name as written in the file.
+            op: Version operator or "@", or empty/None if unpinned.
+            version: Version or URL after the operator, or empty/None if
+                unpinned.
+
+        Returns:
+            Production Dependency sourced from requirements.txt.
+        """
+        if not op:
+            spec = "*"
+        elif op == "@":
+            # Spaced like the pyproject reader so merged sources compare equal
+            spec = f"@ {(version or '').strip()}"
+        else:
+            spec = op + (version or "").strip()
         return Dependency(
-            name=line.lower(),
-            version="*",
+            name=name.lower(),
+            version=spec,
             category="prod",
             source_file="requirements.txt",
         )
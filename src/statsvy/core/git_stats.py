@@ -1,6 +1,7 @@
 """Git repository detection utilities."""
 
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 
 from git import Repo
@@ -173,20 +174,17 @@ class GitStats:
             Sorted list of branch names (limited to max_branches), or None if fails.
         """
         try:
-            branches_output = repo.git.branch("-a").strip()
-            if not branches_output:
-                return None
-            branches = []
-            for line in branches_output.split("\n"):
-                branch = line.strip()
-                if branch.startswith("* "):
-                    branch = branch[2:].strip()
-                if branch.startswith("remotes/"):
-                    continue
-                if branch:
-                    branches.append(branch)
-            unique_branches = sorted(set(branches))
-            return unique_branches[:max_branches] if unique_branches else None
+            # An explicit sort overrides the user's branch.sort config; refname
+            # order lists local branches first, alphabetically, so only the
+            # first max_branches names ever need to be materialized.
+            branches_output = repo.git.branch("-a", "--sort=refname")
+            names = (
+                line.strip().removeprefix("* ").strip()
+                for line in branches_output.splitlines()
+            )
+            local = (name for name in names if name and not name.startswith("remotes/"))
+            branches: list[str] = sorted(islice(local, max_branches))
+            return branches if branches else None
         except (GitCommandError, ValueError):
             return None
 
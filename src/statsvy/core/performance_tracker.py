@@ -68,7 +68,7 @@ class PerformanceTracker:
         if not self._started:
             raise RuntimeError("PerformanceTracker has not been started")
 
-        # Get peak memory usage (in bytes)
+        # Single tracemalloc read; snapshots are O(allocations) and never taken
         _, peak_memory = tracemalloc.get_traced_memory()
         tracemalloc.stop()
         self._started = False
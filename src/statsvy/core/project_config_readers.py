@@ -74,8 +74,7 @@ class PackageJsonReader:
         Raises:
             json.JSONDecodeError: If JSON file is malformed.
         """
-        with open(path, encoding="utf-8") as f:
-            data = json.load(f)
+        data = json.loads(path.read_bytes())
 
         if not isinstance(data, dict):
             return None
@@ -3,12 +3,78 @@
 Orchestrates the discovery and reading of project configuration files.
 """
 
+import functools
+import os
+import stat
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
-from statsvy.config_readers.config_readers_factory import get_reader_for_file
+from statsvy.config_readers.config_readers_factory import get_reader_for_name
 from statsvy.data.project_info import ProjectFileInfo
 from statsvy.utils.project_info_merger import ProjectInfoMerger
 
+# Upper bound on threads used to parse config files concurrently
+_MAX_PARSE_WORKERS = 4
+
+# Files to search for, in priority order. Interned so lookups against the
+# reader registry, which interns the same names, can short-circuit on identity.
+_CANDIDATES = tuple(
+    sys.intern(name)
+    for name in (
+        "pyproject.toml",
+        "package.json",
+        "Cargo.toml",
+        "requirements.txt",
+    )
+)
+_CANDIDATE_NAMES = frozenset(_CANDIDATES)
+
+
+@dataclass(frozen=True, slots=True)
+class _ParseFailure:
+    """Cached outcome of a config file that could not be parsed.
+
+    Attributes:
+        message: Error message of the original parse exception.
+    """
+
+    message: str
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_cached(
+    path: str, _mtime_ns: int, _size: int
+) -> ProjectFileInfo | _ParseFailure | None:
+    """Parse a config file, memoized on its path, mtime and size.
+
+    The modification time and size are only part of the cache key: any edit
+    to the file changes at least one of them and forces a re-parse. Parse
+    errors are cached too, so an unchanged malformed file is not re-parsed
+    on every scan. Read errors are not cached, since fixing permissions does
+    not change the key.
+
+    Args:
+        path: Absolute path to the config file.
+        _mtime_ns: File modification time in nanoseconds.
+        _size: File size in bytes.
+
+    Returns:
+        Parsed ProjectFileInfo, a _ParseFailure if the file is malformed, or
+        None if the file type is not supported.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    reader = get_reader_for_name(os.path.basename(path))
+    if reader is None:
+        return None
+    try:
+        return reader.read_project_info(Path(path))
+    except ValueError as e:
+        return _ParseFailure(str(e))
+
 
 class ProjectScanner:
     """Scans a project directory for configuration files and extracts metadata.
@@ -19,13 +85,10 @@ class ProjectScanner:
     conflict detection.
     """
 
+    __slots__ = ("target_path",)
+
     # Files to search for, in order
-    CONFIG_FILES = (
-        "pyproject.toml",
-        "package.json",
-        "Cargo.toml",
-        "requirements.txt",
-    )
+    CONFIG_FILES = _CANDIDATES
 
     def __init__(self, target_path: Path | str) -> None:
         """Initialize scanner for a project directory.
@@ -33,7 +96,14 @@ class ProjectScanner:
         Args:
             target_path: Path or string path to the project root directory.
         """
-        self.target_path = Path(target_path)
+        self.target_path = (
+            target_path if isinstance(target_path, Path) else Path(target_path)
+        )
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all memoized config file parse results."""
+        _parse_cached.cache_clear()
 
     def scan(self) -> ProjectFileInfo | None:
         """Scan project directory and extract configuration information.
@@ -49,7 +119,19 @@ class ProjectScanner:
         Raises:
             ValueError: If a config file cannot be parsed.
         """
-        found_files = self._find_config_files()
+        # Plain string path for the os calls below; no Path objects are built
+        # on the scan path unless a config file has to be parsed
+        target = os.fspath(self.target_path)
+
+        # One stat call answers both "exists" and "is a directory"
+        try:
+            target_stat = os.stat(target)
+        except OSError:
+            return None
+        if not stat.S_ISDIR(target_stat.st_mode):
+            return None
+
+        found_files = self._find_config_files(target)
 
         if not found_files:
             return None
@@ -61,25 +143,46 @@ class ProjectScanner:
 
         return ProjectInfoMerger.merge(project_infos)
 
-    def _find_config_files(self) -> list[Path]:
+    @staticmethod
+    def _find_config_files(target: str) -> list[os.DirEntry[str]]:
         """Find all supported config files in target directory.
 
+        Lists the directory once with ``os.scandir`` instead of probing each
+        candidate name with its own stat call. Each entry name is checked with
+        a set lookup, and priority order is restored afterwards.
+
+        Args:
+            target: Path to the project directory as a string.
+
         Returns:
-            List of Path objects for found config files.
+            Directory entries for found config files, in priority order.
+
+        Raises:
+            ValueError: If the directory cannot be listed.
         """
-        found_files: list[Path] = []
-        for config_file in self.CONFIG_FILES:
-            file_path = self.target_path / config_file
-            if file_path.is_file():
-                found_files.append(file_path)
-        return found_files
+        try:
+            with os.scandir(target) as it:
+                entries = {
+                    entry.name: entry
+                    for entry in it
+                    if entry.name in _CANDIDATE_NAMES and entry.is_file()
+                }
+        except OSError as e:
+            raise ValueError(f"Failed to list {target}: {e}") from e
+        return [entries[name] for name in _CANDIDATES if name in entries]
 
     @staticmethod
-    def _read_config_files(file_paths: list[Path]) -> list[ProjectFileInfo]:
+    def _read_config_files(
+        entries: list[os.DirEntry[str]],
+    ) -> list[ProjectFileInfo]:
         """Read all config files and return their parsed content.
 
+        When more than one file is found, they are read and parsed on a small
+        thread pool so file I/O overlaps. Results keep the priority order of
+        ``entries`` so merging stays deterministic.
+
         Args:
-            file_paths: List of Path objects to read.
+            entries: Directory entries of the config files to read.
 
         Returns:
             List of ProjectFileInfo objects from successfully read files.
@@ -87,13 +190,42 @@ class ProjectScanner:
         Raises:
             ValueError: If a config file cannot be parsed.
         """
-        project_infos: list[ProjectFileInfo] = []
-        for file_path in file_paths:
-            reader = get_reader_for_file(file_path)
-            if reader:
-                try:
-                    info = reader.read_project_info(file_path)
-                    project_infos.append(info)
-                except (ValueError, OSError) as e:
-                    raise ValueError(f"Failed to parse {file_path.name}: {e}") from e
-        return project_infos
+        if len(entries) > 1:
+            workers = min(_MAX_PARSE_WORKERS, len(entries))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(ProjectScanner._read_entry, entries))
+        else:
+            results = [ProjectScanner._read_entry(entry) for entry in entries]
+        return [info for info in results if info is not None]
+
+    @staticmethod
+    def _read_entry(entry: os.DirEntry[str]) -> ProjectFileInfo | None:
+        """Read a single config file through the parse cache.
+
+        Unchanged files are served from the parse cache, so repeated scans
+        only pay for one stat call per file. ``DirEntry.stat`` caches its
+        result on the entry. The cache is keyed on the absolute path, so a
+        file reached through a relative target shares its entry with scans
+        of the absolute one.
+
+        Args:
+            entry: Directory entry of the config file to read.
+
+        Returns:
+            Parsed ProjectFileInfo, or None if the file type is not supported.
+
+        Raises:
+            ValueError: If the config file cannot be parsed.
+        """
+        try:
+            stat_result = entry.stat()
+            result = _parse_cached(
+                os.path.abspath(entry.path),
+                stat_result.st_mtime_ns,
+                stat_result.st_size,
+            )
+        except OSError as e:
+            raise ValueError(f"Failed to parse {entry.name}: {e}") from e
+        if isinstance(result, _ParseFailure):
+            raise ValueError(f"Failed to parse {entry.name}: {result.message}")
+        return result
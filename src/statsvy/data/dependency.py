@@ -19,6 +19,7 @@ class Dependency:
             (e.g., "pyproject.toml", "requirements.txt").
     """
 
+    # Field order is relied on by positional construction; append new fields
     name: str
     version: str
     category: str
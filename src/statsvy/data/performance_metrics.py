@@ -5,7 +5,10 @@ performance metrics. Currently tracks memory usage; extensible for
 additional metrics like CPU time, I/O statistics, etc.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+_MIB_SHIFT = 20
+_MIB_MASK = (1 << _MIB_SHIFT) - 1
 
 
 @dataclass(frozen=True, slots=True)
@@ -17,6 +20,38 @@ class PerformanceMetrics:
 
     Attributes:
         peak_memory_bytes: Peak memory usage in bytes during the scan.
+        peak_memory_mb: Peak memory in megabytes rounded to 2 decimal places.
+            Derived from peak_memory_bytes once at construction.
     """
 
     peak_memory_bytes: int
+    peak_memory_mb: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute derived values on the otherwise frozen instance."""
+        object.__setattr__(self, "peak_memory_mb", _bytes_to_mb(self.peak_memory_bytes))
+
+    def __hash__(self) -> int:
+        """Hash on peak_memory_bytes, the only field that takes part in eq.
+
+        Returns:
+            Hash of peak_memory_bytes, without building a field tuple.
+        """
+        return hash(self.peak_memory_bytes)
+
+
+def _bytes_to_mb(size_bytes: int) -> float:
+    """Convert a byte count to megabytes rounded to 2 decimal places.
+
+    Exact multiples of 1 MiB take an integer shift instead of a float
+    division and round.
+
+    Args:
+        size_bytes: Size in bytes.
+
+    Returns:
+        Size in MB rounded to 2 decimal places.
+    """
+    if not size_bytes & _MIB_MASK:
+        return float(size_bytes >> _MIB_SHIFT)
+    return round(size_bytes / (1 << _MIB_SHIFT), 2)
@@ -26,3 +26,7 @@ class ProjectFileInfo:
     name: str | None
     dependencies: DependencyInfo | None
     source_files: tuple[str, ...]
+
+
+# Shared result for config files that yield no project information
+EMPTY_PROJECT_FILE_INFO = ProjectFileInfo(name=None, dependencies=None, source_files=())
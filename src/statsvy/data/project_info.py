@@ -9,6 +9,11 @@ without any business logic.
 # Re-export for backward compatibility
 from statsvy.data.dependency import Dependency
 from statsvy.data.dependency_info import DependencyInfo
-from statsvy.data.project_file_info import ProjectFileInfo
+from statsvy.data.project_file_info import EMPTY_PROJECT_FILE_INFO, ProjectFileInfo
 
-__all__ = ["Dependency", "DependencyInfo", "ProjectFileInfo"]
+__all__ = [
+    "EMPTY_PROJECT_FILE_INFO",
+    "Dependency",
+    "DependencyInfo",
+    "ProjectFileInfo",
+]
@@ -17,13 +17,19 @@ HistoryEntry = dict[str, Any]
 def _parse_time(entry: HistoryEntry) -> datetime:
     """Parse the ``time`` field of a history entry into a :class:`datetime`.
 
+    History storage writes ``%Y-%m-%d %H:%M:%S``, which is valid ISO 8601,
+    so the C-level ``fromisoformat`` parser is used instead of ``strptime``.
+
     Args:
         entry: A single history entry dict.
 
     Returns:
         The parsed datetime object.
+
+    Raises:
+        ValueError: If the ``time`` field is not an ISO 8601 timestamp.
     """
-    return datetime.strptime(entry["time"], "%Y-%m-%d %H:%M:%S")
+    return datetime.fromisoformat(entry["time"])
 
 
 class HistoryFormatter:
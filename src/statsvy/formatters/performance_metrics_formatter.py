@@ -23,7 +23,7 @@ class PerformanceMetricsFormatter:
         Returns:
             Peak memory in MB rounded to 2 decimal places.
         """
-        return round(metrics.peak_memory_bytes / (1024 * 1024), 2)
+        return metrics.peak_memory_mb
 
     @staticmethod
     def format_text(metrics: PerformanceMetrics) -> str:
@@ -1,6 +1,7 @@
 """Project information merger for combining multiple config file results."""
 
 from statsvy.data.project_info import (
+    EMPTY_PROJECT_FILE_INFO,
     Dependency,
     DependencyInfo,
     ProjectFileInfo,
@@ -31,7 +32,7 @@ class ProjectInfoMerger:
             combined source files, and detected conflicts.
         """
         if not infos:
-            return ProjectFileInfo(name=None, dependencies=None, source_files=())
+            return EMPTY_PROJECT_FILE_INFO
 
         if len(infos) == 1:
             return infos[0]
@@ -131,61 +132,10 @@ class ProjectInfoMerger:
         Returns:
             List of conflict descriptions.
         """
-        deps_by_name = ProjectInfoMerger._group_deps_by_name(dependencies)
-        conflicts: list[str] = []
-
-        for name, deps in deps_by_name.items():
-            conflict = ProjectInfoMerger._find_version_conflict(name, deps)
-            if conflict:
-                conflicts.append(conflict)
-
-        return conflicts
-
-    @staticmethod
-    def _group_deps_by_name(
-        dependencies: list[Dependency],
-    ) -> dict[str, list[Dependency]]:
-        """Group dependencies by package name.
-
-        Args:
-            dependencies: List of all dependencies.
-
-        Returns:
-            Dictionary mapping package names to list of Dependency objects.
-        """
-        deps_by_name: dict[str, list[Dependency]] = {}
+        accumulator = _DepAccumulator()
         for dep in dependencies:
-            if dep.name not in deps_by_name:
-                deps_by_name[dep.name] = []
-            deps_by_name[dep.name].append(dep)
-        return deps_by_name
-
-    @staticmethod
-    def _find_version_conflict(name: str, deps: list[Dependency]) -> str | None:
-        """Find version conflict for a specific package.
-
-        Args:
-            name: Package name.
-            deps: List of Dependency objects for this package.
-
-        Returns:
-            Conflict description string or None if no conflict.
-        """
-        if len(deps) <= 1:
-            return None
-
-        versions_by_file: dict[str, set[str]] = {}
-        for dep in deps:
-            if dep.source_file not in versions_by_file:
-                versions_by_file[dep.source_file] = set()
-            versions_by_file[dep.source_file].add(dep.version)
-
-        # Conflict only if multiple files with different versions
-        if len(versions_by_file) <= 1:
-            return None
-
-        version_strs = ProjectInfoMerger._format_version_strings(versions_by_file)
-        return f"{name}: {'; '.join(version_strs)}"
+            accumulator.add(dep.name, dep.version, dep.source_file)
+        return accumulator.conflicts()
 
     @staticmethod
     def _format_version_strings(
@@ -204,3 +154,42 @@ class ProjectInfoMerger:
             version_list = ", ".join(sorted(versions))
             version_strs.append(f"{file_name} has {version_list}")
         return version_strs
+
+
+class _DepAccumulator:
+    """Single-pass index of dependency versions by package and source file.
+
+    Replaces grouping dependencies into per-name lists and then re-scanning
+    each list: every dependency is appended exactly once, and conflicts are
+    read straight off the index.
+    """
+
+    __slots__ = ("_versions",)
+
+    def __init__(self) -> None:
+        """Initialize an empty accumulator."""
+        self._versions: dict[str, dict[str, set[str]]] = {}
+
+    def add(self, name: str, version: str, source_file: str) -> None:
+        """Record one dependency occurrence.
+
+        Args:
+            name: Package name.
+            version: Version specification string.
+            source_file: Config file the dependency came from.
+        """
+        by_file = self._versions.setdefault(name, {})
+        by_file.setdefault(source_file, set()).add(version)
+
+    def conflicts(self) -> list[str]:
+        """Describe packages declared in more than one source file.
+
+        Returns:
+            Conflict descriptions in first-seen package order.
+        """
+        conflicts: list[str] = []
+        for name, by_file in self._versions.items():
+            if len(by_file) > 1:
+                version_strs = ProjectInfoMerger._format_version_strings(by_file)
+                conflicts.append(f"{name}: {'; '.join(version_strs)}")
+        return conflicts
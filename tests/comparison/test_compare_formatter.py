@@ -6,6 +6,8 @@ from statsvy.core.comparison import ComparisonAnalyzer
 from statsvy.data.metrics import Metrics
 from statsvy.formatters.compare_formatter import CompareFormatter
 
+_FORMATTER = CompareFormatter()
+
 
 def test_compare_formatter_table_contains_project_names(
     sample_metrics_project1: Metrics, sample_metrics_project2: Metrics
@@ -14,8 +16,7 @@ def test_compare_formatter_table_contains_project_names(
     comparison = ComparisonAnalyzer.compare(
         sample_metrics_project1, sample_metrics_project2
     )
-    formatter = CompareFormatter()
-    output = formatter.format_table(comparison)
+    output = _FORMATTER.format_table(comparison)
 
     assert sample_metrics_project1.name in output
     assert sample_metrics_project2.name in output
@@ -28,8 +29,7 @@ def test_compare_formatter_table_contains_metrics(
     comparison = ComparisonAnalyzer.compare(
         sample_metrics_project1, sample_metrics_project2
     )
-    formatter = CompareFormatter()
-    output = formatter.format_table(comparison)
+    output = _FORMATTER.format_table(comparison)
 
     # Should contain file counts
     assert "42" in output  # project1 files
@@ -47,8 +47,7 @@ def test_compare_formatter_table_contains_deltas(
     comparison = ComparisonAnalyzer.compare(
         sample_metrics_project1, sample_metrics_project2
     )
-    formatter = CompareFormatter()
-    output = formatter.format_table(comparison)
+    output = _FORMATTER.format_table(comparison)
 
     # Should show deltas (may be formatted with +/- and colors)
     assert "16" in output or "+16" in output  # file delta
@@ -63,8 +62,7 @@ def test_compare_formatter_json_valid(
     comparison = ComparisonAnalyzer.compare(
         sample_metrics_project1, sample_metrics_project2
     )
-    formatter = CompareFormatter()
-    output = formatter.format_json(comparison)
+    output = _FORMATTER.format_json(comparison)
 
     # Should parse as valid JSON
     data = json.loads(output)
@@ -80,8 +78,7 @@ def test_compare_formatter_json_contains_projects(
     comparison = ComparisonAnalyzer.compare(
         sample_metrics_project1, sample_metrics_project2
     )
-    formatter = CompareFormatter()
-    output = formatter.format_json(comparison)
+    output = _FORMATTER.format_json(comparison)
     data = json.loads(output)
 
     assert data["project1"]["name"] == "Project Alpha"
@@ -95,8 +92,7 @@ def test_compare_formatter_json_contains_comparison(
     comparison = ComparisonAnalyzer.compare(
         sample_metrics_project1, sample_metrics_project2
     )
-    formatter = CompareFormatter()
-    output = formatter.format_json(comparison)
+    output = _FORMATTER.format_json(comparison)
     data = json.loads(output)
 
     assert "overall" in data["comparison"]
@@ -114,8 +110,7 @@ def test_compare_formatter_markdown_contains_headers(
     comparison = ComparisonAnalyzer.compare(
         sample_metrics_project1, sample_metrics_project2
     )
-    formatter = CompareFormatter()
-    output = formatter.format_markdown(comparison)
+    output = _FORMATTER.format_markdown(comparison)
 
     assert "# Comparison" in output
     assert "## Overall Comparison" in output
@@ -130,8 +125,7 @@ def test_compare_formatter_markdown_contains_tables(
     comparison = ComparisonAnalyzer.compare(
         sample_metrics_project1, sample_metrics_project2
     )
-    formatter = CompareFormatter()
-    output = formatter.format_markdown(comparison)
+    output = _FORMATTER.format_markdown(comparison)
 
     # Check for markdown table syntax
     assert "|" in output
@@ -145,8 +139,7 @@ def test_compare_formatter_markdown_contains_values(
     comparison = ComparisonAnalyzer.compare(
         sample_metrics_project1, sample_metrics_project2
     )
-    formatter = CompareFormatter()
-    output = formatter.format_markdown(comparison)
+    output = _FORMATTER.format_markdown(comparison)
 
     # Check for project names
     assert "Project Alpha" in output
@@ -124,3 +124,11 @@ class TestConfigReadersIntegration:
 
             assert reader is not None
             assert hasattr(reader, "read_project_info")
+
+    def test_returns_shared_reader_instance(self, tmp_path: Path) -> None:
+        """Test that readers are reused rather than rebuilt per call."""
+        first = get_reader_for_file(tmp_path / "pyproject.toml")
+        second = get_reader_for_file(Path("elsewhere") / "pyproject.toml")
+
+        assert first is not None
+        assert first is second
@@ -372,3 +372,63 @@ class TestRequirementsTxtReaderEdgeCases:
         result = reader.read_project_info(req_file)
         assert result.dependencies is not None
         assert result.dependencies.total_count == 2
+
+    def test_skips_pip_option_lines(
+        self, reader: RequirementsTxtReader, tmp_path: Path
+    ) -> None:
+        """Test that pip options such as -r and --index-url are not deps."""
+        req_file = tmp_path / "requirements.txt"
+        req_file.write_text(
+            "-r base.txt\n--index-url https://example.com\n-e .\nclick>=8.0.0\n"
+        )
+        result = reader.read_project_info(req_file)
+        assert result.dependencies is not None
+        assert [dep.name for dep in result.dependencies.dependencies] == ["click"]
+
+    def test_strips_environment_markers(
+        self, reader: RequirementsTxtReader, tmp_path: Path
+    ) -> None:
+        """Test that environment markers are not part of the version."""
+        req_file = tmp_path / "requirements.txt"
+        req_file.write_text("click>=8.0.0; python_version < '3.12'\n")
+        result = reader.read_project_info(req_file)
+        assert result.dependencies is not None
+        dep = result.dependencies.dependencies[0]
+        assert dep.name == "click"
+        assert dep.version == ">=8.0.0"
+
+    def test_streams_large_file(
+        self, reader: RequirementsTxtReader, tmp_path: Path
+    ) -> None:
+        """Test that files over the streaming threshold parse identically."""
+        req_file = tmp_path / "requirements.txt"
+        padding = "# " + "x" * 1000 + "\n"
+        body = "click>=8.0.0  # CLI\n\nrequests[security]\n-r base.txt\n"
+        req_file.write_text(padding * 1100 + body)
+        result = reader.read_project_info(req_file)
+        assert result.dependencies is not None
+        deps = result.dependencies.dependencies
+        assert [(d.name, d.version) for d in deps] == [
+            ("click", ">=8.0.0"),
+            ("requests", "*"),
+        ]
+
+    @pytest.mark.parametrize("padding_lines", [0, 1100], ids=["read", "streamed"])
+    def test_parses_direct_reference(
+        self, reader: RequirementsTxtReader, tmp_path: Path, padding_lines: int
+    ) -> None:
+        """Test that PEP 508 direct references are kept on both read paths."""
+        req_file = tmp_path / "requirements.txt"
+        padding = "# " + "x" * 1000 + "\n"
+        body = (
+            "click>=8.0.0\n"
+            "foo @ https://example.com/foo-1.0-py3-none-any.whl ; os_name == 'nt'\n"
+        )
+        req_file.write_text(padding * padding_lines + body)
+        result = reader.read_project_info(req_file)
+        assert result.dependencies is not None
+        deps = result.dependencies.dependencies
+        assert [(d.name, d.version) for d in deps] == [
+            ("click", ">=8.0.0"),
+            ("foo", "@ https://example.com/foo-1.0-py3-none-any.whl"),
+        ]
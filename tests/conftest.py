@@ -1,32 +1,37 @@
-"""Shared pytest fixtures for formatter tests."""
+"""Shared pytest fixtures for formatter tests.
+
+The fixtures are frozen Metrics instances, so they are session-scoped and
+shared by every test that reads them.
+"""
 
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock
 
 import pytest
 
+from statsvy.data.metrics import Metrics
+
 
 def _make_metrics(
     *,
     name: str = "my_project",
     path: str = "/home/user/project",
     total_files: int = 42,
-    total_size: float = 1.5,
+    total_size_kb: int = 1536,
     total_lines: int = 1000,
-    lines_by_category: dict | None = None,
-    lines_by_lang: dict | None = None,
-    comment_lines_by_lang: dict | None = None,
-    blank_lines_by_lang: dict | None = None,
+    lines_by_category: dict[str, int] | None = None,
+    lines_by_lang: dict[str, int] | None = None,
+    comment_lines_by_lang: dict[str, int] | None = None,
+    blank_lines_by_lang: dict[str, int] | None = None,
     timestamp: datetime | None = None,
-) -> MagicMock:
-    """Create a mock Metrics object with sensible defaults.
+) -> Metrics:
+    """Create a Metrics object with sensible defaults.
 
     Args:
         name: Project name.
         path: Filesystem path.
         total_files: Number of scanned files.
-        total_size: Total size in megabytes.
+        total_size_kb: Total size in kilobytes.
         total_lines: Total line count.
         lines_by_category: Optional mapping of category -> line count.
         lines_by_lang: Optional mapping of language -> line count.
@@ -35,31 +40,36 @@ def _make_metrics(
         timestamp: Optional scan timestamp.
 
     Returns:
-        MagicMock: A mock that quacks like a Metrics object.
+        Metrics: A frozen metrics instance built from the given values.
     """
-    m = MagicMock()
-    m.name = name
-    m.path = Path(path)
-    m.total_files = total_files
-    m.total_size_mb = total_size
-    m.total_size_kb = int(total_size * 1024)
-    m.total_lines = total_lines
-    m.timestamp = timestamp or datetime(2024, 6, 1, 12, 0, 0)
-    m.lines_by_category = lines_by_category or {}
-    m.lines_by_lang = lines_by_lang or {}
-    m.comment_lines_by_lang = comment_lines_by_lang or {}
-    m.blank_lines_by_lang = blank_lines_by_lang or {}
-    return m
+    comment_lines_by_lang = comment_lines_by_lang or {}
+    blank_lines_by_lang = blank_lines_by_lang or {}
+    return Metrics(
+        name=name,
+        path=Path(path),
+        timestamp=timestamp or datetime(2024, 6, 1, 12, 0, 0),
+        total_files=total_files,
+        total_size_bytes=total_size_kb * 1024,
+        total_size_kb=total_size_kb,
+        total_size_mb=total_size_kb // 1024,
+        lines_by_lang=lines_by_lang or {},
+        comment_lines_by_lang=comment_lines_by_lang,
+        blank_lines_by_lang=blank_lines_by_lang,
+        lines_by_category=lines_by_category or {},
+        comment_lines=sum(comment_lines_by_lang.values()),
+        blank_lines=sum(blank_lines_by_lang.values()),
+        total_lines=total_lines,
+    )
 
 
-@pytest.fixture()
-def minimal_metrics() -> MagicMock:
+@pytest.fixture(scope="session")
+def minimal_metrics() -> Metrics:
     """Metrics with no language or category data."""
     return _make_metrics()
 
 
-@pytest.fixture()
-def full_metrics() -> MagicMock:
+@pytest.fixture(scope="session")
+def full_metrics() -> Metrics:
     """Metrics with both category and language data."""
     return _make_metrics(
         name="statsvy",
@@ -71,8 +81,8 @@ def full_metrics() -> MagicMock:
     )
 
 
-@pytest.fixture()
-def zero_lines_metrics() -> MagicMock:
+@pytest.fixture(scope="session")
+def zero_lines_metrics() -> Metrics:
     """Metrics where total_lines is zero."""
     return _make_metrics(
         total_lines=0,
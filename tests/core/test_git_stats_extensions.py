@@ -64,6 +64,7 @@ class TestGetBranches:
         assert result is not None
         assert len(result) == 3
         assert result == ["branch-0", "branch-1", "branch-2"]
+        mock_repo.git.branch.assert_called_once_with("-a", "--sort=refname")
 
     def test_skips_remote_branches(self) -> None:
         """Should not include remote branches."""
@@ -40,6 +40,8 @@ class TestPerformanceTracker:
             assert isinstance(metrics, PerformanceMetrics)
             assert metrics.peak_memory_bytes == 50_000_000
             assert not tracker.is_active()
+            mock_tm.get_traced_memory.assert_called_once()
+            mock_tm.take_snapshot.assert_not_called()
             mock_tm.stop.assert_called_once()
 
     def test_tracker_cannot_start_twice(self) -> None:
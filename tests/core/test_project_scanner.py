@@ -6,9 +6,11 @@ files, detecting the appropriate reader for each file type.
 
 import json
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from statsvy.config_readers.pyproject_reader import PyProjectReader
 from statsvy.core.project_scanner import ProjectScanner
 from statsvy.data.project_info import ProjectFileInfo
 
@@ -71,6 +73,12 @@ class TestProjectScannerBasics:
         scanner = ProjectScanner(tmp_path)
         assert scanner.target_path == tmp_path
 
+    def test_project_scanner_has_slots(self, tmp_path: Path) -> None:
+        """Test that ProjectScanner uses __slots__ for memory efficiency."""
+        assert ProjectScanner.__slots__ == ("target_path",)
+        scanner = ProjectScanner(tmp_path)
+        assert not hasattr(scanner, "__dict__")
+
     def test_returns_none_when_no_config_files_found(self, tmp_path: Path) -> None:
         """Test that None is returned when no config files found."""
         scanner = ProjectScanner(tmp_path)
@@ -224,6 +232,17 @@ class TestProjectScannerErrorHandling:
         with pytest.raises(ValueError):
             scanner.scan()
 
+    def test_raises_on_malformed_file_among_several(self, tmp_path: Path) -> None:
+        """Test that a parse error is raised when several files are read."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text('[project]\nname = "my-project"')
+        package = tmp_path / "package.json"
+        package.write_text("{invalid json}")
+
+        scanner = ProjectScanner(tmp_path)
+        with pytest.raises(ValueError, match=r"package\.json"):
+            scanner.scan()
+
     def test_skips_file_if_unreadable(self, tmp_path: Path) -> None:
         """Test that scanner handles unreadable files."""
         pyproject = tmp_path / "pyproject.toml"
@@ -279,6 +298,17 @@ class TestProjectScannerConfigFilePriority:
         # Should have both files in sources
         assert len(result.source_files) >= 2
 
+    def test_ignores_unsupported_files_and_directories(self, tmp_path: Path) -> None:
+        """Test that only supported regular files are picked up."""
+        (tmp_path / "setup.cfg").write_text("[metadata]\nname = other")
+        (tmp_path / "package.json").mkdir()
+        (tmp_path / "Cargo.toml").write_text('[package]\nname = "rust"')
+
+        result = ProjectScanner(tmp_path).scan()
+
+        assert result is not None
+        assert result.source_files == ("Cargo.toml",)
+
 
 class TestProjectScannerEdgeCases:
     """Tests for edge cases and boundary conditions."""
@@ -332,8 +362,16 @@ class TestProjectScannerEdgeCases:
         scanner = ProjectScanner(str(tmp_path))
         result = scanner.scan()
 
+        assert isinstance(scanner.target_path, Path)
+        assert scanner.target_path == tmp_path
         assert result is not None
 
+    def test_keeps_given_path_object(self, tmp_path: Path) -> None:
+        """Test that a Path argument is stored without being rebuilt."""
+        scanner = ProjectScanner(tmp_path)
+
+        assert scanner.target_path is tmp_path
+
 
 class TestProjectScannerReturnType:
     """Tests for return type and structure."""
@@ -391,3 +429,65 @@ dependencies = ["click>=8.0.0"]
         assert result.dependencies is not None
         assert len(result.source_files) == 2
         assert result.dependencies.total_count >= 2
+
+
+class TestProjectScannerCache:
+    """Tests for the config file parse cache."""
+
+    def test_reuses_result_for_unchanged_file(self, sample_pyproject: Path) -> None:
+        """Test that an unchanged file is not parsed twice."""
+        ProjectScanner.clear_cache()
+        first = ProjectScanner(sample_pyproject).scan()
+        second = ProjectScanner(sample_pyproject).scan()
+
+        assert first is not None
+        assert second is first
+
+    def test_relative_and_absolute_targets_share_entry(
+        self, sample_pyproject: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the cache key does not depend on the working directory."""
+        ProjectScanner.clear_cache()
+        absolute = ProjectScanner(sample_pyproject).scan()
+
+        monkeypatch.chdir(sample_pyproject.parent)
+        relative = ProjectScanner(sample_pyproject.name).scan()
+
+        assert absolute is not None
+        assert relative is absolute
+
+    def test_reparses_after_file_change(self, sample_pyproject: Path) -> None:
+        """Test that editing a file invalidates its cached result."""
+        ProjectScanner.clear_cache()
+        first = ProjectScanner(sample_pyproject).scan()
+
+        pyproject = sample_pyproject / "pyproject.toml"
+        pyproject.write_text('[project]\nname = "renamed-project"\n')
+        second = ProjectScanner(sample_pyproject).scan()
+
+        assert first is not None
+        assert second is not None
+        assert second.name == "renamed-project"
+
+    def test_clear_cache_forces_reparse(self, sample_pyproject: Path) -> None:
+        """Test that clear_cache drops memoized results."""
+        first = ProjectScanner(sample_pyproject).scan()
+        ProjectScanner.clear_cache()
+        second = ProjectScanner(sample_pyproject).scan()
+
+        assert second == first
+        assert second is not first
+
+    def test_caches_parse_failure_for_unchanged_file(self, tmp_path: Path) -> None:
+        """Test that an unchanged malformed file is parsed only once."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text("[project\nname = invalid")
+
+        with patch.object(
+            PyProjectReader, "read_project_info", side_effect=ValueError("boom")
+        ) as mock_read:
+            for _ in range(2):
+                with pytest.raises(ValueError, match="boom"):
+                    ProjectScanner(tmp_path).scan()
+
+        assert mock_read.call_count == 1
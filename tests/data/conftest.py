@@ -0,0 +1,95 @@
+"""Shared fixtures for data structure tests.
+
+The data classes under test are frozen, so module-scoped instances can be
+shared safely between tests.
+"""
+
+import pytest
+
+from statsvy.data.project_info import Dependency, DependencyInfo, ProjectFileInfo
+
+
+@pytest.fixture(scope="module")
+def click_dep() -> Dependency:
+    """Creates a production dependency on click.
+
+    Returns:
+        Dependency: click ">=8.0.0" from pyproject.toml.
+    """
+    return Dependency("click", ">=8.0.0", "prod", "pyproject.toml")
+
+
+@pytest.fixture(scope="module")
+def click_dep_v9() -> Dependency:
+    """Creates the click dependency with a different version pin.
+
+    Returns:
+        Dependency: click ">=9.0.0" from pyproject.toml.
+    """
+    return Dependency("click", ">=9.0.0", "prod", "pyproject.toml")
+
+
+@pytest.fixture(scope="module")
+def dev_dep() -> Dependency:
+    """Creates a development dependency on pytest.
+
+    Returns:
+        Dependency: pytest "^7.0" from pyproject.toml.
+    """
+    return Dependency("pytest", "^7.0", "dev", "pyproject.toml")
+
+
+@pytest.fixture(scope="module")
+def sample_deps(click_dep: Dependency, dev_dep: Dependency) -> tuple[Dependency, ...]:
+    """Creates one production and one development dependency.
+
+    Returns:
+        tuple[Dependency, ...]: The click and pytest dependencies.
+    """
+    return (click_dep, dev_dep)
+
+
+@pytest.fixture(scope="module")
+def sample_dep_info(sample_deps: tuple[Dependency, ...]) -> DependencyInfo:
+    """Creates DependencyInfo for the sample dependencies.
+
+    Returns:
+        DependencyInfo: Counts and sources for a single pyproject.toml.
+    """
+    return DependencyInfo(
+        dependencies=sample_deps,
+        prod_count=1,
+        dev_count=1,
+        optional_count=0,
+        total_count=2,
+        sources=("pyproject.toml",),
+        conflicts=(),
+    )
+
+
+@pytest.fixture(scope="module")
+def project_file_info() -> ProjectFileInfo:
+    """Creates ProjectFileInfo for a project without dependencies.
+
+    Returns:
+        ProjectFileInfo: "my-project" read from pyproject.toml.
+    """
+    return ProjectFileInfo(
+        name="my-project",
+        dependencies=None,
+        source_files=("pyproject.toml",),
+    )
+
+
+@pytest.fixture(scope="module")
+def other_project_file_info() -> ProjectFileInfo:
+    """Creates ProjectFileInfo that differs from project_file_info by name.
+
+    Returns:
+        ProjectFileInfo: "other-project" read from pyproject.toml.
+    """
+    return ProjectFileInfo(
+        name="other-project",
+        dependencies=None,
+        source_files=("pyproject.toml",),
+    )
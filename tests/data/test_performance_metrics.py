@@ -53,6 +53,22 @@ class TestPerformanceMetrics:
         assert result["peak_memory_bytes"] == 52_428_800
         assert result["peak_memory_mb"] == 50.0
 
+    def test_peak_memory_mb_precomputed(self) -> None:
+        """Test peak_memory_mb is derived once at construction."""
+        metrics = PerformanceMetrics(peak_memory_bytes=45_329_555)
+
+        assert metrics.peak_memory_mb == 43.23
+        assert "peak_memory_mb" in PerformanceMetrics.__slots__
+        with pytest.raises(AttributeError):
+            metrics.peak_memory_mb = 1.0  # type: ignore
+
+    def test_peak_memory_mb_exact_mib_is_float(self) -> None:
+        """Test the exact-MiB fast path still returns a float."""
+        metrics = PerformanceMetrics(peak_memory_bytes=3 * 1024 * 1024)
+
+        assert metrics.peak_memory_mb == 3.0
+        assert isinstance(metrics.peak_memory_mb, float)
+
     def test_performance_metrics_is_immutable(self) -> None:
         """Test that PerformanceMetrics is immutable (frozen)."""
         metrics = PerformanceMetrics(peak_memory_bytes=50_000_000)
@@ -68,6 +84,15 @@ class TestPerformanceMetrics:
         slots = PerformanceMetrics.__slots__
         assert "peak_memory_bytes" in slots
 
+    def test_equal_metrics_hash_equal(self) -> None:
+        """Test that equal metrics hash alike and deduplicate in a set."""
+        first = PerformanceMetrics(peak_memory_bytes=50_000_000)
+        second = PerformanceMetrics(peak_memory_bytes=50_000_000)
+
+        assert hash(first) == hash(first)
+        assert hash(first) == hash(second)
+        assert len({first, second, PerformanceMetrics(peak_memory_bytes=1)}) == 2
+
     def test_zero_memory_metrics(self) -> None:
         """Test metrics with zero memory values."""
         metrics = PerformanceMetrics(peak_memory_bytes=0)
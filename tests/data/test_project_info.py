@@ -4,151 +4,96 @@ Tests verify that immutable dataclasses maintain data integrity and
 cannot be accidentally modified after creation.
 """
 
-from dataclasses import FrozenInstanceError
+from dataclasses import FrozenInstanceError, replace
 
 import pytest
 
 from statsvy.data.project_info import Dependency, DependencyInfo, ProjectFileInfo
 
 
+def _assert_frozen(obj: object, attr: str, value: object) -> None:
+    """Assert that assigning ``value`` to ``obj.attr`` is rejected.
+
+    Args:
+        obj: Frozen dataclass instance.
+        attr: Name of the field to assign.
+        value: Value to try to assign.
+    """
+    with pytest.raises(FrozenInstanceError):
+        setattr(obj, attr, value)
+
+
 class TestDependency:
     """Tests for Dependency immutable dataclass."""
 
-    def test_creates_dependency_with_all_fields(self) -> None:
+    def test_creates_dependency_with_all_fields(self, click_dep: Dependency) -> None:
         """Test that Dependency is created with all fields."""
-        dep = Dependency(
-            name="click",
-            version=">=8.0.0",
-            category="prod",
-            source_file="pyproject.toml",
-        )
+        dep = click_dep
         assert dep.name == "click"
         assert dep.version == ">=8.0.0"
         assert dep.category == "prod"
         assert dep.source_file == "pyproject.toml"
 
-    def test_is_immutable_cannot_modify_name(self) -> None:
-        """Test that Dependency is frozen and cannot be modified."""
-        dep = Dependency(
-            name="click",
-            version=">=8.0.0",
-            category="prod",
-            source_file="pyproject.toml",
-        )
-        with pytest.raises(FrozenInstanceError):
-            dep.name = "modified"  # type: ignore[misc]
-
-    def test_is_immutable_cannot_modify_version(self) -> None:
-        """Test that Dependency version cannot be modified."""
-        dep = Dependency(
-            name="click",
-            version=">=8.0.0",
-            category="prod",
-            source_file="pyproject.toml",
-        )
-        with pytest.raises(FrozenInstanceError):
-            dep.version = "1.0.0"  # type: ignore[misc]
-
-    def test_is_immutable_cannot_modify_category(self) -> None:
-        """Test that Dependency category cannot be modified."""
-        dep = Dependency(
-            name="click",
-            version=">=8.0.0",
-            category="prod",
-            source_file="pyproject.toml",
-        )
-        with pytest.raises(FrozenInstanceError):
-            dep.category = "dev"  # type: ignore[misc]
-
-    def test_is_immutable_cannot_modify_source_file(self) -> None:
-        """Test that Dependency source_file cannot be modified."""
-        dep = Dependency(
-            name="click",
-            version=">=8.0.0",
-            category="prod",
-            source_file="pyproject.toml",
-        )
-        with pytest.raises(FrozenInstanceError):
-            dep.source_file = "requirements.txt"  # type: ignore[misc]
-
-    def test_dependency_with_dev_category(self) -> None:
-        """Test Dependency can have dev category."""
-        dep = Dependency(
-            name="pytest",
-            version="^7.0.0",
-            category="dev",
-            source_file="pyproject.toml",
-        )
-        assert dep.category == "dev"
-
-    def test_dependency_with_optional_category(self) -> None:
-        """Test Dependency can have optional category."""
-        dep = Dependency(
-            name="extra-lib",
-            version="~1.2.3",
-            category="optional",
-            source_file="pyproject.toml",
-        )
-        assert dep.category == "optional"
-
-    def test_dependency_with_wildcard_version(self) -> None:
-        """Test Dependency can have wildcard version."""
-        dep = Dependency(
-            name="somepackage",
-            version="*",
-            category="prod",
-            source_file="requirements.txt",
-        )
-        assert dep.version == "*"
-
-    def test_dependency_equality(self) -> None:
+    @pytest.mark.parametrize(
+        ("attr", "value"),
+        [
+            ("name", "modified"),
+            ("version", "1.0.0"),
+            ("category", "dev"),
+            ("source_file", "requirements.txt"),
+        ],
+    )
+    def test_is_immutable(
+        self, click_dep: Dependency, attr: str, value: object
+    ) -> None:
+        """Test that Dependency fields cannot be modified."""
+        _assert_frozen(click_dep, attr, value)
+
+    @pytest.mark.parametrize(
+        ("name", "version", "category", "source_file"),
+        [
+            ("pytest", "^7.0.0", "dev", "pyproject.toml"),
+            ("extra-lib", "~1.2.3", "optional", "pyproject.toml"),
+            ("somepackage", "*", "prod", "requirements.txt"),
+        ],
+    )
+    def test_dependency_stores_fields(
+        self, name: str, version: str, category: str, source_file: str
+    ) -> None:
+        """Test Dependency keeps categories and version specs as given."""
+        dep = Dependency(name, version, category, source_file)
+        assert (dep.name, dep.version, dep.category, dep.source_file) == (
+            name,
+            version,
+            category,
+            source_file,
+        )
+
+    def test_dependency_equality(self, click_dep: Dependency) -> None:
         """Test that identical Dependencies are equal."""
-        dep1 = Dependency(
-            name="click",
-            version=">=8.0.0",
-            category="prod",
-            source_file="pyproject.toml",
-        )
-        dep2 = Dependency(
-            name="click",
-            version=">=8.0.0",
-            category="prod",
-            source_file="pyproject.toml",
-        )
-        assert dep1 == dep2
+        # replace() gives a distinct instance, so eq cannot pass on identity
+        assert click_dep == replace(click_dep)
 
-    def test_dependency_inequality(self) -> None:
+    def test_dependency_inequality(
+        self, click_dep: Dependency, click_dep_v9: Dependency
+    ) -> None:
         """Test that different Dependencies are not equal."""
-        dep1 = Dependency(
-            name="click",
-            version=">=8.0.0",
-            category="prod",
-            source_file="pyproject.toml",
-        )
-        dep2 = Dependency(
-            name="click",
-            version=">=9.0.0",
-            category="prod",
-            source_file="pyproject.toml",
-        )
-        assert dep1 != dep2
+        assert click_dep != click_dep_v9
+
+    def test_uses_slots(self, click_dep: Dependency) -> None:
+        """Test that Dependency instances carry no per-instance __dict__."""
+        assert not hasattr(click_dep, "__dict__")
 
 
 class TestDependencyInfo:
     """Tests for DependencyInfo immutable dataclass."""
 
-    def _make_dependencies(self) -> tuple[Dependency, ...]:
-        """Create sample dependencies for testing."""
-        return (
-            Dependency("click", ">=8.0.0", "prod", "pyproject.toml"),
-            Dependency("pytest", "^7.0", "dev", "pyproject.toml"),
-        )
-
-    def test_creates_dependency_info_with_all_fields(self) -> None:
+    def test_creates_dependency_info_with_all_fields(
+        self, sample_deps: tuple[Dependency, ...]
+    ) -> None:
         """Test that DependencyInfo is created with all fields."""
-        deps = self._make_dependencies()
         info = DependencyInfo(
-            dependencies=deps,
+            dependencies=sample_deps,
             prod_count=1,
             dev_count=1,
             optional_count=0,
@@ -162,71 +107,27 @@ class TestDependencyInfo:
         assert info.total_count == 2
         assert len(info.dependencies) == 2
 
-    def test_is_immutable_cannot_modify_dependencies(self) -> None:
-        """Test that DependencyInfo dependencies tuple cannot be modified."""
-        deps = self._make_dependencies()
-        info = DependencyInfo(
-            dependencies=deps,
-            prod_count=1,
-            dev_count=1,
-            optional_count=0,
-            total_count=2,
-            sources=("pyproject.toml",),
-            conflicts=(),
-        )
-        with pytest.raises(FrozenInstanceError):
-            info.dependencies = ()  # type: ignore[misc]
-
-    def test_is_immutable_cannot_modify_counts(self) -> None:
-        """Test that DependencyInfo counts cannot be modified."""
-        deps = self._make_dependencies()
-        info = DependencyInfo(
-            dependencies=deps,
-            prod_count=1,
-            dev_count=1,
-            optional_count=0,
-            total_count=2,
-            sources=("pyproject.toml",),
-            conflicts=(),
-        )
-        with pytest.raises(FrozenInstanceError):
-            info.prod_count = 10  # type: ignore[misc]
-
-    def test_is_immutable_cannot_modify_sources(self) -> None:
-        """Test that DependencyInfo sources cannot be modified."""
-        deps = self._make_dependencies()
-        info = DependencyInfo(
-            dependencies=deps,
-            prod_count=1,
-            dev_count=1,
-            optional_count=0,
-            total_count=2,
-            sources=("pyproject.toml",),
-            conflicts=(),
-        )
-        with pytest.raises(FrozenInstanceError):
-            info.sources = ()  # type: ignore[misc]
-
-    def test_is_immutable_cannot_modify_conflicts(self) -> None:
-        """Test that DependencyInfo conflicts cannot be modified."""
-        deps = self._make_dependencies()
-        info = DependencyInfo(
-            dependencies=deps,
-            prod_count=1,
-            dev_count=1,
-            optional_count=0,
-            total_count=2,
-            sources=("pyproject.toml",),
-            conflicts=(),
-        )
-        with pytest.raises(FrozenInstanceError):
-            info.conflicts = ("conflict",)  # type: ignore[misc]
-
-    def test_handles_multiple_sources(self) -> None:
+    @pytest.mark.parametrize(
+        ("attr", "value"),
+        [
+            ("dependencies", ()),
+            ("prod_count", 10),
+            ("sources", ()),
+            ("conflicts", ("conflict",)),
+        ],
+    )
+    def test_is_immutable(
+        self, sample_dep_info: DependencyInfo, attr: str, value: object
+    ) -> None:
+        """Test that DependencyInfo fields cannot be modified."""
+        _assert_frozen(sample_dep_info, attr, value)
+
+    def test_handles_multiple_sources(
+        self, sample_deps: tuple[Dependency, ...]
+    ) -> None:
         """Test DependencyInfo with multiple source files."""
-        deps = self._make_dependencies()
         info = DependencyInfo(
-            dependencies=deps,
+            dependencies=sample_deps,
             prod_count=1,
             dev_count=1,
             optional_count=0,
@@ -234,16 +135,13 @@ class TestDependencyInfo:
             sources=("pyproject.toml", "requirements.txt"),
             conflicts=(),
         )
-        assert len(info.sources) == 2
-        assert "pyproject.toml" in info.sources
-        assert "requirements.txt" in info.sources
+        assert info.sources == ("pyproject.toml", "requirements.txt")
 
-    def test_handles_conflicts(self) -> None:
+    def test_handles_conflicts(self, sample_deps: tuple[Dependency, ...]) -> None:
         """Test DependencyInfo can contain conflicts."""
-        deps = self._make_dependencies()
         conflict_msg = "click: pyproject.toml has >=8.0.0; requirements.txt has >=9.0.0"
         info = DependencyInfo(
-            dependencies=deps,
+            dependencies=sample_deps,
             prod_count=1,
             dev_count=1,
             optional_count=0,
@@ -251,8 +149,7 @@ class TestDependencyInfo:
             sources=("pyproject.toml", "requirements.txt"),
             conflicts=(conflict_msg,),
         )
-        assert len(info.conflicts) == 1
-        assert conflict_msg in info.conflicts
+        assert info.conflicts == (conflict_msg,)
 
     def test_zero_dependencies(self) -> None:
         """Test DependencyInfo with no dependencies."""
@@ -268,32 +165,21 @@ class TestDependencyInfo:
         assert len(info.dependencies) == 0
         assert info.total_count == 0
 
+    def test_uses_slots(self, sample_dep_info: DependencyInfo) -> None:
+        """Test that DependencyInfo instances carry no per-instance __dict__."""
+        assert not hasattr(sample_dep_info, "__dict__")
+
 
 class TestProjectFileInfo:
     """Tests for ProjectFileInfo immutable dataclass."""
 
-    def _make_dep_info(self) -> DependencyInfo:
-        """Create sample DependencyInfo for testing."""
-        deps = (
-            Dependency("click", ">=8.0.0", "prod", "pyproject.toml"),
-            Dependency("pytest", "^7.0", "dev", "pyproject.toml"),
-        )
-        return DependencyInfo(
-            dependencies=deps,
-            prod_count=1,
-            dev_count=1,
-            optional_count=0,
-            total_count=2,
-            sources=("pyproject.toml",),
-            conflicts=(),
-        )
-
-    def test_creates_project_file_info_with_all_fields(self) -> None:
+    def test_creates_project_file_info_with_all_fields(
+        self, sample_dep_info: DependencyInfo
+    ) -> None:
         """Test that ProjectFileInfo is created with all fields."""
-        dep_info = self._make_dep_info()
         info = ProjectFileInfo(
             name="my-project",
-            dependencies=dep_info,
+            dependencies=sample_dep_info,
             source_files=("pyproject.toml",),
         )
         assert info.name == "my-project"
@@ -310,46 +196,34 @@ class TestProjectFileInfo:
         assert info.name == "my-project"
         assert info.dependencies is None
 
-    def test_creates_project_file_info_with_none_name(self) -> None:
+    def test_creates_project_file_info_with_none_name(
+        self, sample_dep_info: DependencyInfo
+    ) -> None:
         """Test ProjectFileInfo can have None name."""
-        dep_info = self._make_dep_info()
         info = ProjectFileInfo(
             name=None,
-            dependencies=dep_info,
+            dependencies=sample_dep_info,
             source_files=("requirements.txt",),
         )
         assert info.name is None
         assert info.dependencies is not None
 
-    def test_is_immutable_cannot_modify_name(self) -> None:
-        """Test that ProjectFileInfo name cannot be modified."""
-        info = ProjectFileInfo(
-            name="my-project",
-            dependencies=None,
-            source_files=(),
-        )
-        with pytest.raises(FrozenInstanceError):
-            info.name = "new-name"  # type: ignore[misc]
-
-    def test_is_immutable_cannot_modify_dependencies(self) -> None:
-        """Test that ProjectFileInfo dependencies cannot be modified."""
-        info = ProjectFileInfo(
-            name="my-project",
-            dependencies=None,
-            source_files=(),
-        )
-        with pytest.raises(FrozenInstanceError):
-            info.dependencies = self._make_dep_info()  # type: ignore[misc]
-
-    def test_is_immutable_cannot_modify_source_files(self) -> None:
-        """Test that ProjectFileInfo source_files cannot be modified."""
+    @pytest.mark.parametrize(
+        ("attr", "value"),
+        [
+            ("name", "new-name"),
+            ("dependencies", None),
+            ("source_files", ()),
+        ],
+    )
+    def test_is_immutable(self, attr: str, value: object) -> None:
+        """Test that ProjectFileInfo fields cannot be modified."""
         info = ProjectFileInfo(
             name="my-project",
             dependencies=None,
             source_files=("pyproject.toml",),
         )
-        with pytest.raises(FrozenInstanceError):
-            info.source_files = ()  # type: ignore[misc]
+        _assert_frozen(info, attr, value)
 
     def test_multiple_source_files(self) -> None:
         """Test ProjectFileInfo with multiple source files."""
@@ -358,35 +232,27 @@ class TestProjectFileInfo:
             dependencies=None,
             source_files=("pyproject.toml", "requirements.txt", "Cargo.toml"),
         )
-        assert len(info.source_files) == 3
-        assert "pyproject.toml" in info.source_files
-        assert "requirements.txt" in info.source_files
-        assert "Cargo.toml" in info.source_files
+        assert info.source_files == (
+            "pyproject.toml",
+            "requirements.txt",
+            "Cargo.toml",
+        )
 
-    def test_equality_identical_instances(self) -> None:
+    def test_equality_identical_instances(
+        self, project_file_info: ProjectFileInfo
+    ) -> None:
         """Test that identical ProjectFileInfo instances are equal."""
-        info1 = ProjectFileInfo(
-            name="my-project",
-            dependencies=None,
-            source_files=("pyproject.toml",),
-        )
-        info2 = ProjectFileInfo(
-            name="my-project",
-            dependencies=None,
-            source_files=("pyproject.toml",),
-        )
-        assert info1 == info2
+        assert project_file_info == replace(project_file_info)
 
-    def test_inequality_different_names(self) -> None:
+    def test_inequality_different_names(
+        self,
+        project_file_info: ProjectFileInfo,
+        other_project_file_info: ProjectFileInfo,
+    ) -> None:
         """Test that ProjectFileInfo with different names are not equal."""
-        info1 = ProjectFileInfo(
-            name="my-project",
-            dependencies=None,
-            source_files=("pyproject.toml",),
-        )
-        info2 = ProjectFileInfo(
-            name="other-project",
-            dependencies=None,
-            source_files=("pyproject.toml",),
-        )
-        assert info1 != info2
+        assert project_file_info != other_project_file_info
+
+    def test_uses_slots(self) -> None:
+        """Test that ProjectFileInfo instances carry no per-instance __dict__."""
+        info = ProjectFileInfo(name=None, dependencies=None, source_files=())
+        assert not hasattr(info, "__dict__")
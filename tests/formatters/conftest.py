@@ -1,14 +1,25 @@
-"""Shared fixtures for formatters tests."""
+"""Shared fixtures for formatters tests.
 
+Metrics is frozen, so fixtures are module-scoped and built once per module.
+"""
+
+from collections.abc import Mapping
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 
+from statsvy.core.comparison import ComparisonAnalyzer
+from statsvy.data.comparison_result import ComparisonResult
+from statsvy.data.config import DisplayConfig
 from statsvy.data.metrics import Metrics
+from statsvy.formatters.compare_formatter import CompareFormatter
+from statsvy.formatters.history_formatter import HistoryEntry, HistoryFormatter
+from statsvy.formatters.table_formatter import TableFormatter
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_metrics() -> Metrics:
     """Creates a sample Metrics object populated with dummy data for testing.
 
@@ -33,7 +44,7 @@ def sample_metrics() -> Metrics:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def empty_metrics() -> Metrics:
     """Creates a Metrics object with no files or lines.
 
@@ -56,3 +67,265 @@ def empty_metrics() -> Metrics:
         blank_lines=0,
         total_lines=0,
     )
+
+
+@pytest.fixture(scope="module")
+def sample_table_output(sample_metrics: Metrics) -> str:
+    """Renders ``sample_metrics`` with a default TableFormatter once.
+
+    Returns:
+        str: Table output for the sample metrics.
+    """
+    return TableFormatter().format(sample_metrics)
+
+
+@pytest.fixture(scope="module")
+def empty_table_output(empty_metrics: Metrics) -> str:
+    """Renders ``empty_metrics`` with a default TableFormatter once.
+
+    Returns:
+        str: Table output for the empty metrics.
+    """
+    return TableFormatter().format(empty_metrics)
+
+
+@pytest.fixture(scope="module")
+def project1_metrics() -> Metrics:
+    """Create first project metrics for comparison testing."""
+    return Metrics(
+        name="Project Alpha",
+        path=Path("/home/user/project1"),
+        timestamp=datetime(2024, 1, 1, 10, 0, 0),
+        total_files=100,
+        total_size_bytes=2097152,
+        total_size_kb=2048,
+        total_size_mb=2,
+        lines_by_lang={"Python": 5000, "JavaScript": 2000},
+        comment_lines_by_lang={"Python": 500, "JavaScript": 200},
+        blank_lines_by_lang={"Python": 300, "JavaScript": 150},
+        lines_by_category={"programming": 7000},
+        comment_lines=700,
+        blank_lines=450,
+        total_lines=7500,
+    )
+
+
+@pytest.fixture(scope="module")
+def project2_metrics() -> Metrics:
+    """Create second project metrics for comparison testing."""
+    return Metrics(
+        name="Project Beta",
+        path=Path("/home/user/project2"),
+        timestamp=datetime(2024, 2, 1, 10, 0, 0),
+        total_files=120,
+        total_size_bytes=2621440,
+        total_size_kb=2560,
+        total_size_mb=3,
+        lines_by_lang={"Python": 6000, "JavaScript": 2500},
+        comment_lines_by_lang={"Python": 600, "JavaScript": 250},
+        blank_lines_by_lang={"Python": 350, "JavaScript": 180},
+        lines_by_category={"programming": 8500},
+        comment_lines=850,
+        blank_lines=530,
+        total_lines=9000,
+    )
+
+
+@pytest.fixture(scope="module")
+def comparison(
+    project1_metrics: Metrics, project2_metrics: Metrics
+) -> ComparisonResult:
+    """Compare the two project metrics fixtures once per module.
+
+    Returns:
+        ComparisonResult: Project Alpha compared against Project Beta.
+    """
+    return ComparisonAnalyzer.compare(project1_metrics, project2_metrics)
+
+
+@pytest.fixture(scope="module")
+def formatter_pct() -> CompareFormatter:
+    """Creates a CompareFormatter that shows percentage deltas.
+
+    Returns:
+        CompareFormatter: Formatter with show_percentages enabled.
+    """
+    return CompareFormatter(DisplayConfig(truncate_paths=False, show_percentages=True))
+
+
+@pytest.fixture(scope="module")
+def formatter_no_pct() -> CompareFormatter:
+    """Creates a CompareFormatter that hides percentage deltas.
+
+    Returns:
+        CompareFormatter: Formatter with show_percentages disabled.
+    """
+    return CompareFormatter(DisplayConfig(truncate_paths=False, show_percentages=False))
+
+
+@pytest.fixture()
+def captured_print(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Collects the first argument of each console.print call as a string.
+
+    A plain list append is much cheaper than MagicMock call tracking.
+
+    Returns:
+        list[str]: Printed lines, in call order.
+    """
+    lines: list[str] = []
+
+    def _print(*args: object, **_kwargs: object) -> None:
+        lines.append(str(args[0]) if args else "")
+
+    monkeypatch.setattr("statsvy.formatters.summary_formatter.console.print", _print)
+    return lines
+
+
+# Read-only so entries can share it instead of each taking a copy
+_DEFAULT_CATEGORIES: Mapping[str, int] = MappingProxyType(
+    {
+        "programming": 5_000,
+        "data": 4_000,
+        "prose": 1_000,
+        "unknown": 0,
+    }
+)
+
+
+def _make_entry(
+    time: str = "2026-02-13 15:04:45",
+    total_files: int = 50,
+    total_lines: int = 500,
+    total_size: str = "0 MB (400 KB)",
+    categories: dict[str, int] | None = None,
+) -> HistoryEntry:
+    """Build a minimal history entry dict for use in tests.
+
+    Args:
+        time: Timestamp string in ``%Y-%m-%d %H:%M:%S`` format.
+        total_files: Number of files in the scan.
+        total_lines: Total line count for the scan.
+        total_size: Human-readable size string.
+        categories: Mapping of category name to line count.
+
+    Returns:
+        A history entry dict matching the structure produced by the scanner.
+    """
+    return {
+        "time": time,
+        "metrics": {
+            "name": "/home/user/project",
+            "path": "/home/user/project",
+            "timestamp": time[:10],
+            "total_files": total_files,
+            "total_size": total_size,
+            "total_lines": total_lines,
+            "lines_by_category": categories
+            if categories is not None
+            else _DEFAULT_CATEGORIES,
+            "lines_by_language": {},
+        },
+    }
+
+
+@pytest.fixture(scope="session")
+def history_formatter() -> HistoryFormatter:
+    """Creates a HistoryFormatter shared by all history tests.
+
+    Returns:
+        HistoryFormatter: Stateless formatter instance.
+    """
+    return HistoryFormatter()
+
+
+@pytest.fixture(scope="session")
+def single_entry() -> list[HistoryEntry]:
+    """Creates a history with one default entry.
+
+    Returns:
+        list[HistoryEntry]: One scan of 500 lines.
+    """
+    return [_make_entry()]
+
+
+@pytest.fixture(scope="session")
+def two_entries() -> list[HistoryEntry]:
+    """Creates a history where the line count grows.
+
+    Returns:
+        list[HistoryEntry]: Two scans going from 500 to 600 lines.
+    """
+    return [
+        _make_entry(
+            time="2026-02-13 10:00:00",
+            total_files=50,
+            total_lines=500,
+            categories={"programming": 300, "data": 150, "prose": 50, "unknown": 0},
+        ),
+        _make_entry(
+            time="2026-02-13 11:00:00",
+            total_files=52,
+            total_lines=600,
+            categories={"programming": 350, "data": 200, "prose": 50, "unknown": 0},
+        ),
+    ]
+
+
+@pytest.fixture(scope="session")
+def three_entries() -> list[HistoryEntry]:
+    """Creates a history where the line count grows and then shrinks.
+
+    Returns:
+        list[HistoryEntry]: Three scans of 400, 500 and 450 lines.
+    """
+    return [
+        _make_entry(
+            time="2026-02-13 09:00:00",
+            total_lines=400,
+            categories={"programming": 200, "data": 150, "prose": 50, "unknown": 0},
+        ),
+        _make_entry(
+            time="2026-02-13 10:00:00",
+            total_lines=500,
+            categories={"programming": 300, "data": 150, "prose": 50, "unknown": 0},
+        ),
+        _make_entry(
+            time="2026-02-13 11:00:00",
+            total_lines=450,
+            categories={"programming": 250, "data": 150, "prose": 50, "unknown": 0},
+        ),
+    ]
+
+
+@pytest.fixture(scope="session")
+def three_entries_rendered(
+    history_formatter: HistoryFormatter, three_entries: list[HistoryEntry]
+) -> str:
+    """Renders ``three_entries`` once for tests that only read the output.
+
+    Returns:
+        str: The formatted history for the three-entry scan history.
+    """
+    return history_formatter.format(three_entries)
+
+
+@pytest.fixture(scope="session")
+def entry_without_total_size() -> list[HistoryEntry]:
+    """Creates a history whose only entry lacks ``total_size``.
+
+    Returns:
+        list[HistoryEntry]: One default entry with ``total_size`` removed.
+    """
+    entry = _make_entry()
+    del entry["metrics"]["total_size"]
+    return [entry]
+
+
+@pytest.fixture(scope="session")
+def entry_without_categories() -> list[HistoryEntry]:
+    """Creates a history whose only entry has no category counts.
+
+    Returns:
+        list[HistoryEntry]: One default entry with empty ``lines_by_category``.
+    """
+    return [_make_entry(categories={})]
@@ -1,5 +1,6 @@
 """Tests for display customization options (truncate paths, percentages)."""
 
+import re
 from datetime import datetime
 from pathlib import Path
 
@@ -10,8 +11,20 @@ from statsvy.data.metrics import Metrics
 from statsvy.formatters.markdown_formatter import MarkdownFormatter
 from statsvy.formatters.table_formatter import TableFormatter
 
+# DisplayConfig is frozen, so each combination is built once and shared
+_TRUNCATED_WITH_PCT = DisplayConfig(truncate_paths=True, show_percentages=True)
+_FULL_WITH_PCT = DisplayConfig(truncate_paths=False, show_percentages=True)
+_FULL_NO_PCT = DisplayConfig(truncate_paths=False, show_percentages=False)
 
-@pytest.fixture
+# A category data row (programming in any case, or data) carrying a % sign
+_CATEGORY_ROW_WITH_PCT = re.compile(
+    r"^(?=[^\n]*(?:(?i:programming)|data))[^\n]*%", re.MULTILINE
+)
+# First non-blank line after the markdown category heading: the table header
+_CATEGORY_MD_HEADER = re.compile(r"## Lines of Code by Type[^\n]*\n+([^\n]+)")
+
+
+@pytest.fixture(scope="module")
 def sample_metrics() -> Metrics:
     """Create sample metrics for testing display customization."""
     return Metrics(
@@ -35,63 +48,30 @@ def sample_metrics() -> Metrics:
 class TestPathTruncation:
     """Tests for path truncation display option."""
 
-    def test_table_formatter_truncates_paths_when_enabled(
-        self, sample_metrics: Metrics
-    ) -> None:
-        """TableFormatter should truncate paths when truncate_paths=True."""
-        display_config = DisplayConfig(
-            truncate_paths=True,
-            show_percentages=True,
-        )
-        formatter = TableFormatter(display_config)
-        result = formatter.format(sample_metrics)
-
-        # Should contain truncated path with ellipsis
-        assert "..." in result
-        assert "home/user/.../module" in result or "/home/user/.../module" in result
-
-    def test_table_formatter_shows_full_paths_when_disabled(
-        self, sample_metrics: Metrics
-    ) -> None:
-        """TableFormatter should show full paths when truncate_paths=False."""
-        display_config = DisplayConfig(
-            truncate_paths=False,
-            show_percentages=True,
-        )
-        formatter = TableFormatter(display_config)
-        result = formatter.format(sample_metrics)
-
-        # Should contain full path
-        assert "/home/user/projects/statsvy/src/module" in result
-
-    def test_markdown_formatter_truncates_paths_when_enabled(
-        self, sample_metrics: Metrics
-    ) -> None:
-        """MarkdownFormatter should truncate paths when truncate_paths=True."""
-        display_config = DisplayConfig(
-            truncate_paths=True,
-            show_percentages=True,
-        )
-        formatter = MarkdownFormatter(display_config)
-        result = formatter.format(sample_metrics)
-
-        # Should contain truncated path
-        assert "..." in result
-        assert "home/user/.../module" in result or "/home/user/.../module" in result
-
-    def test_markdown_formatter_shows_full_paths_when_disabled(
-        self, sample_metrics: Metrics
+    @pytest.mark.parametrize(
+        "formatter_cls",
+        [TableFormatter, MarkdownFormatter],
+        ids=["table", "markdown"],
+    )
+    @pytest.mark.parametrize(
+        ("display_config", "expected"),
+        [
+            (_TRUNCATED_WITH_PCT, "home/user/.../module"),
+            (_FULL_WITH_PCT, "/home/user/projects/statsvy/src/module"),
+        ],
+        ids=["truncated", "full"],
+    )
+    def test_path_rendering(
+        self,
+        sample_metrics: Metrics,
+        formatter_cls: type[TableFormatter | MarkdownFormatter],
+        display_config: DisplayConfig,
+        expected: str,
     ) -> None:
-        """MarkdownFormatter should show full paths when truncate_paths=False."""
-        display_config = DisplayConfig(
-            truncate_paths=False,
-            show_percentages=True,
-        )
-        formatter = MarkdownFormatter(display_config)
-        result = formatter.format(sample_metrics)
+        """Formatters should truncate paths only when truncate_paths=True."""
+        result = formatter_cls(display_config).format(sample_metrics)
 
-        # Should contain full path
-        assert "/home/user/projects/statsvy/src/module" in result
+        assert expected in result
 
 
 class TestPercentageDisplay:
@@ -101,11 +81,7 @@ class TestPercentageDisplay:
         self, sample_metrics: Metrics
     ) -> None:
         """TableFormatter should show percentage columns when show_percentages=True."""
-        display_config = DisplayConfig(
-            truncate_paths=False,
-            show_percentages=True,
-        )
-        formatter = TableFormatter(display_config)
+        formatter = TableFormatter(_FULL_WITH_PCT)
         result = formatter.format(sample_metrics)
 
         # Should contain percentage symbol
@@ -115,33 +91,22 @@ class TestPercentageDisplay:
         self, sample_metrics: Metrics
     ) -> None:
         """TableFormatter should hide percentage columns when show_percentages=False."""
-        display_config = DisplayConfig(
-            truncate_paths=False,
-            show_percentages=False,
-        )
-        formatter = TableFormatter(display_config)
+        formatter = TableFormatter(_FULL_NO_PCT)
         result = formatter.format(sample_metrics)
 
-        # Should not contain standalone percentage symbol in tables
+        # Category data rows from the first "Lines of Code by" section onwards
+        # should not have % when disabled
         # (Note: Git stats might still have % in some fields)
-        lines = result.split("\n")
-        category_section = False
-        for line in lines:
-            if "Lines of Code by" in line:
-                category_section = True
-            if category_section and ("programming" in line.lower() or "data" in line):
-                # These data lines should not have % when disabled
-                assert "%" not in line
+        section = result.find("Lines of Code by")
+        assert section != -1
+        line_start = result.rfind("\n", 0, section) + 1
+        assert not _CATEGORY_ROW_WITH_PCT.search(result, line_start)
 
     def test_markdown_formatter_shows_percentages_when_enabled(
         self, sample_metrics: Metrics
     ) -> None:
         """MarkdownFormatter shows percentage columns when enabled."""
-        display_config = DisplayConfig(
-            truncate_paths=False,
-            show_percentages=True,
-        )
-        formatter = MarkdownFormatter(display_config)
+        formatter = MarkdownFormatter(_FULL_WITH_PCT)
         result = formatter.format(sample_metrics)
 
         # Should contain percentage column header and values
@@ -151,21 +116,13 @@ class TestPercentageDisplay:
         self, sample_metrics: Metrics
     ) -> None:
         """MarkdownFormatter hides percentage columns when disabled."""
-        display_config = DisplayConfig(
-            truncate_paths=False,
-            show_percentages=False,
-        )
-        formatter = MarkdownFormatter(display_config)
+        formatter = MarkdownFormatter(_FULL_NO_PCT)
         result = formatter.format(sample_metrics)
 
         # Check that category table doesn't have % column
-        lines = result.split("\n")
-        for i, line in enumerate(lines):
-            if "## Lines of Code by Type" in line:
-                # Next line should be header without %
-                header = lines[i + 1]
-                assert "| % |" not in header
-                break
+        match = _CATEGORY_MD_HEADER.search(result)
+        assert match is not None
+        assert "| % |" not in match.group(1)
 
 
 class TestDefaultBehavior:
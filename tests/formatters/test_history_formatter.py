@@ -1,7 +1,9 @@
 """Tests for the history_formatter module."""
 
+import re
 from datetime import datetime
 
+import pytest
 from rich.table import Table
 
 from statsvy.formatters.history_formatter import (
@@ -10,207 +12,131 @@ from statsvy.formatters.history_formatter import (
     _parse_time,
 )
 
-_DEFAULT_CATEGORIES: dict[str, int] = {
-    "programming": 5_000,
-    "data": 4_000,
-    "prose": 1_000,
-    "unknown": 0,
-}
-
-
-def _make_entry(
-    time: str = "2026-02-13 15:04:45",
-    total_files: int = 50,
-    total_lines: int = 500,
-    total_size: str = "0 MB (400 KB)",
-    categories: dict[str, int] | None = None,
-) -> HistoryEntry:
-    """Build a minimal history entry dict for use in tests.
-
-    Args:
-        time: Timestamp string in ``%Y-%m-%d %H:%M:%S`` format.
-        total_files: Number of files in the scan.
-        total_lines: Total line count for the scan.
-        total_size: Human-readable size string.
-        categories: Mapping of category name to line count. Defaults to
-            :data:`_DEFAULT_CATEGORIES` when ``None``.
-
-    Returns:
-        A history entry dict matching the structure produced by the scanner.
-    """
-    return {
-        "time": time,
-        "metrics": {
-            "name": "/home/user/project",
-            "path": "/home/user/project",
-            "timestamp": time[:10],
-            "total_files": total_files,
-            "total_size": total_size,
-            "total_lines": total_lines,
-            "lines_by_category": categories
-            if categories is not None
-            else dict(_DEFAULT_CATEGORIES),
-            "lines_by_language": {},
-        },
-    }
-
-
-SINGLE_ENTRY: list[HistoryEntry] = [_make_entry()]
-
-TWO_ENTRIES: list[HistoryEntry] = [
-    _make_entry(
-        time="2026-02-13 10:00:00",
-        total_files=50,
-        total_lines=500,
-        categories={"programming": 300, "data": 150, "prose": 50, "unknown": 0},
-    ),
-    _make_entry(
-        time="2026-02-13 11:00:00",
-        total_files=52,
-        total_lines=600,
-        categories={"programming": 350, "data": 200, "prose": 50, "unknown": 0},
-    ),
-]
-
-THREE_ENTRIES: list[HistoryEntry] = [
-    _make_entry(
-        time="2026-02-13 09:00:00",
-        total_lines=400,
-        categories={"programming": 200, "data": 150, "prose": 50, "unknown": 0},
-    ),
-    _make_entry(
-        time="2026-02-13 10:00:00",
-        total_lines=500,
-        categories={"programming": 300, "data": 150, "prose": 50, "unknown": 0},
-    ),
-    _make_entry(
-        time="2026-02-13 11:00:00",
-        total_lines=450,
-        categories={"programming": 250, "data": 150, "prose": 50, "unknown": 0},
-    ),
-]
+# Row indices 1, 2 and 3 as standalone numbers, in order
+_ROW_INDICES = re.compile(r"\b1\b.*\b2\b.*\b3\b", re.DOTALL)
 
 
 class TestParseTime:
     """Tests for the :func:`_parse_time` helper."""
 
-    def test_returns_correct_datetime(self) -> None:
+    @pytest.mark.parametrize(
+        ("time_str", "expected"),
+        [
+            ("2026-02-13 15:04:45", datetime(2026, 2, 13, 15, 4, 45)),
+            ("2026-01-01 00:00:00", datetime(2026, 1, 1, 0, 0, 0)),
+        ],
+        ids=["afternoon", "midnight"],
+    )
+    def test_parse_time(self, time_str: str, expected: datetime) -> None:
         """Should parse the ``time`` field into the expected datetime."""
-        entry = _make_entry(time="2026-02-13 15:04:45")
-        result = _parse_time(entry)
-        assert result == datetime(2026, 2, 13, 15, 4, 45)
-
-    def test_midnight(self) -> None:
-        """Should handle midnight timestamps without error."""
-        entry = _make_entry(time="2026-01-01 00:00:00")
-        result = _parse_time(entry)
-        assert result == datetime(2026, 1, 1, 0, 0, 0)
+        assert _parse_time({"time": time_str}) == expected
 
 
 class TestHistoryFormatterFormat:
     """Tests for :meth:`HistoryFormatter.format`."""
 
-    def test_returns_string(self) -> None:
+    def test_returns_string(
+        self, history_formatter: HistoryFormatter, single_entry: list[HistoryEntry]
+    ) -> None:
         """``format`` should always return a ``str``."""
-        formatter = HistoryFormatter()
-        result = formatter.format(SINGLE_ENTRY)
+        result = history_formatter.format(single_entry)
         assert isinstance(result, str)
 
-    def test_empty_list_returns_string(self) -> None:
+    def test_empty_list_returns_string(
+        self, history_formatter: HistoryFormatter
+    ) -> None:
         """``format`` should not raise when given an empty entry list."""
-        formatter = HistoryFormatter()
-        result = formatter.format([])
+        result = history_formatter.format([])
         assert isinstance(result, str)
 
-    def test_empty_list_mentions_no_history(self) -> None:
+    def test_empty_list_mentions_no_history(
+        self, history_formatter: HistoryFormatter
+    ) -> None:
         """The output for an empty list should indicate there is nothing to show."""
-        formatter = HistoryFormatter()
-        result = formatter.format([])
+        result = history_formatter.format([])
         assert "No history entries" in result
 
-    def test_header_panel_present(self) -> None:
+    def test_header_panel_present(
+        self, history_formatter: HistoryFormatter, single_entry: list[HistoryEntry]
+    ) -> None:
         """Output should include the ``Scan History`` header text."""
-        formatter = HistoryFormatter()
-        result = formatter.format(SINGLE_ENTRY)
+        result = history_formatter.format(single_entry)
         assert "Scan History" in result
 
-    def test_timestamp_present(self) -> None:
+    def test_timestamp_present(
+        self, history_formatter: HistoryFormatter, single_entry: list[HistoryEntry]
+    ) -> None:
         """The formatted timestamp should appear in the output."""
-        formatter = HistoryFormatter()
-        result = formatter.format(SINGLE_ENTRY)
+        result = history_formatter.format(single_entry)
         assert "2026-02-13" in result
 
-    def test_total_lines_present(self) -> None:
+    def test_total_lines_present(
+        self, history_formatter: HistoryFormatter, single_entry: list[HistoryEntry]
+    ) -> None:
         """Total line count should appear in the rendered output."""
-        formatter = HistoryFormatter()
-        result = formatter.format(SINGLE_ENTRY)
+        result = history_formatter.format(single_entry)
         assert "500" in result
 
-    def test_first_row_has_no_delta(self) -> None:
+    def test_first_row_has_no_delta(
+        self, history_formatter: HistoryFormatter, single_entry: list[HistoryEntry]
+    ) -> None:
         """The very first row should display ``-`` (no delta) for all Δ columns."""
-        formatter = HistoryFormatter()
-        result = formatter.format(SINGLE_ENTRY)
+        result = history_formatter.format(single_entry)
         assert "-" in result
 
-    def test_second_row_has_positive_delta(self) -> None:
+    def test_second_row_has_positive_delta(
+        self, history_formatter: HistoryFormatter, two_entries: list[HistoryEntry]
+    ) -> None:
         """A row where lines increased should contain a ``+`` delta string."""
-        formatter = HistoryFormatter()
-        result = formatter.format(TWO_ENTRIES)
+        result = history_formatter.format(two_entries)
         assert "+" in result
 
-    def test_decreasing_entry_has_negative_delta(self) -> None:
+    def test_decreasing_entry_has_negative_delta(
+        self, three_entries_rendered: str
+    ) -> None:
         """A row where lines decreased should contain a ``-`` delta string."""
-        formatter = HistoryFormatter()
-        result = formatter.format(THREE_ENTRIES)
-        assert "-" in result
+        assert "-" in three_entries_rendered
 
-    def test_multiple_entries_all_indexed(self) -> None:
+    def test_multiple_entries_all_indexed(self, three_entries_rendered: str) -> None:
         """Every entry should receive a sequential row index starting at 1."""
-        formatter = HistoryFormatter()
-        result = formatter.format(THREE_ENTRIES)
-        for idx in ("1", "2", "3"):
-            assert idx in result
+        assert _ROW_INDICES.search(three_entries_rendered)
 
-    def test_size_string_present(self) -> None:
+    def test_size_string_present(
+        self, history_formatter: HistoryFormatter, single_entry: list[HistoryEntry]
+    ) -> None:
         """The total_size value should appear somewhere in the output."""
-        formatter = HistoryFormatter()
-        result = formatter.format(SINGLE_ENTRY)
+        result = history_formatter.format(single_entry)
         assert "KB" in result
 
 
 class TestCreateHistoryTable:
     """Tests for :meth:`HistoryFormatter._create_history_table`."""
 
-    def test_returns_rich_table(self) -> None:
+    def test_returns_rich_table(
+        self, history_formatter: HistoryFormatter, single_entry: list[HistoryEntry]
+    ) -> None:
         """Should return a Rich :class:`~rich.table.Table` object."""
-        formatter = HistoryFormatter()
-        table = formatter._create_history_table(SINGLE_ENTRY)
+        table = history_formatter._create_history_table(single_entry)
         assert isinstance(table, Table)
 
-    def test_row_count_matches_entries(self) -> None:
-        """The table should have exactly as many rows as entries."""
-        formatter = HistoryFormatter()
-        table = formatter._create_history_table(TWO_ENTRIES)
-        assert table.row_count == len(TWO_ENTRIES)
-
-    def test_single_entry_row_count(self) -> None:
-        """A single entry should produce exactly one row."""
-        formatter = HistoryFormatter()
-        table = formatter._create_history_table(SINGLE_ENTRY)
-        assert table.row_count == 1
-
-    def test_entry_missing_total_size_defaults_to_dash(self) -> None:
-        """Entries without ``total_size`` should show ``-`` without raising."""
-        entry: HistoryEntry = _make_entry()
-        del entry["metrics"]["total_size"]
-        formatter = HistoryFormatter()
-        table = formatter._create_history_table([entry])
-        assert table.row_count == 1
-
-    def test_entry_missing_category_defaults_to_zero(self) -> None:
-        """Missing category keys should default to ``0`` without raising."""
-        entry: HistoryEntry = _make_entry()
-        entry["metrics"]["lines_by_category"] = {}
-        formatter = HistoryFormatter()
-        table = formatter._create_history_table([entry])
-        assert table.row_count == 1
+    @pytest.mark.parametrize(
+        ("entries_fixture", "expected_rows"),
+        [
+            ("single_entry", 1),
+            ("two_entries", 2),
+            ("entry_without_total_size", 1),
+            ("entry_without_categories", 1),
+        ],
+        ids=["single", "two", "missing-size", "missing-categories"],
+    )
+    def test_row_count(
+        self,
+        history_formatter: HistoryFormatter,
+        request: pytest.FixtureRequest,
+        entries_fixture: str,
+        expected_rows: int,
+    ) -> None:
+        """Should emit one row per entry, tolerating missing optional fields."""
+        entries: list[HistoryEntry] = request.getfixturevalue(entries_fixture)
+        table = history_formatter._create_history_table(entries)
+        assert table.row_count == expected_rows
@@ -1,5 +1,7 @@
 """Tests for the delta_str helper function."""
 
+import pytest
+
 from statsvy.utils.formatting import delta_str as _delta_str
 
 
@@ -10,34 +12,33 @@ class TestDeltaStr:
         """Should return ``-`` when ``previous`` is ``None``."""
         assert _delta_str(100, None) == "-"
 
-    def test_positive_delta_uses_positive_color(self) -> None:
-        """Should include ``+`` prefix and the positive colour tag."""
-        result = _delta_str(110, 100)
-        assert "+10" in result
-        assert "spring_green3" in result
-
-    def test_negative_delta_uses_red(self) -> None:
-        """Should include ``red`` colour tag for negative deltas."""
-        result = _delta_str(90, 100)
-        assert "-10" in result
-        assert "red" in result
-
-    def test_zero_delta_uses_neutral_style(self) -> None:
-        """Should return a neutral ``±0`` string when values are equal."""
-        result = _delta_str(100, 100)
-        assert "±0" in result
-
-    def test_custom_positive_color(self) -> None:
-        """Should respect a custom ``color_pos`` argument."""
-        result = _delta_str(200, 100, color_pos="magenta")
-        assert "magenta" in result
-
-    def test_large_positive_delta_has_thousands_separator(self) -> None:
-        """Large positive deltas should be formatted with commas."""
-        result = _delta_str(11_000, 0)
-        assert "11,000" in result
-
-    def test_large_negative_delta_has_thousands_separator(self) -> None:
-        """Large negative deltas should be formatted with commas."""
-        result = _delta_str(0, 11_000)
-        assert "-11,000" in result
+    @pytest.mark.parametrize(
+        ("current", "previous", "kwargs", "needles"),
+        [
+            (110, 100, {}, ("+10", "spring_green3")),
+            (90, 100, {}, ("-10", "red")),
+            (100, 100, {}, ("±0",)),
+            (200, 100, {"color_pos": "magenta"}, ("magenta",)),
+            (11_000, 0, {}, ("11,000",)),
+            (0, 11_000, {}, ("-11,000",)),
+        ],
+        ids=[
+            "positive-uses-positive-color",
+            "negative-uses-red",
+            "zero-is-neutral",
+            "custom-positive-color",
+            "large-positive-thousands-separator",
+            "large-negative-thousands-separator",
+        ],
+    )
+    def test_delta_contents(
+        self,
+        current: int,
+        previous: int,
+        kwargs: dict[str, str],
+        needles: tuple[str, ...],
+    ) -> None:
+        """Should render the signed delta with the expected colour markup."""
+        result = _delta_str(current, previous, **kwargs)
+        for needle in needles:
+            assert needle in result
@@ -1,80 +1,87 @@
 """Tests for MarkdownFormatter."""
 
-from unittest.mock import MagicMock
+import pytest
 
+from statsvy.data.metrics import Metrics
 from statsvy.formatters.markdown_formatter import MarkdownFormatter
 
+_FORMATTER = MarkdownFormatter()
+
+
+@pytest.fixture(scope="module")
+def minimal_markdown(minimal_metrics: Metrics) -> str:
+    """Renders ``minimal_metrics`` once for read-only checks.
+
+    Returns:
+        str: Markdown output for the minimal metrics.
+    """
+    return _FORMATTER.format(minimal_metrics)
+
+
+@pytest.fixture(scope="module")
+def full_markdown(full_metrics: Metrics) -> str:
+    """Renders ``full_metrics`` once for read-only checks.
+
+    Returns:
+        str: Markdown output for the full metrics.
+    """
+    return _FORMATTER.format(full_metrics)
+
 
 class TestMarkdownFormatter:
     """Tests for MarkdownFormatter."""
 
-    def test_returns_string(self, minimal_metrics: MagicMock) -> None:
+    def test_returns_string(self, minimal_markdown: str) -> None:
         """Return type must be str."""
-        assert isinstance(MarkdownFormatter().format(minimal_metrics), str)
-
-    def test_heading_contains_project_name(self, minimal_metrics: MagicMock) -> None:
-        """The H1 heading must include the project name."""
-        result = MarkdownFormatter().format(minimal_metrics)
-        assert "# Scan: my_project" in result
-
-    def test_summary_table_fields(self, minimal_metrics: MagicMock) -> None:
-        """Summary section must contain all key fields."""
-        result = MarkdownFormatter().format(minimal_metrics)
-        assert "## Project Statistics" in result
-        assert "/home/user/project" in result
-        assert "2024-06-01" in result
-        assert "42" in result
-        assert "1.5 MB" in result
-        assert "1,000" in result
-
-    def test_no_category_section_when_empty(self, minimal_metrics: MagicMock) -> None:
-        """Category section must not appear when there is no category data."""
-        result = MarkdownFormatter().format(minimal_metrics)
-        assert "Lines of Code by Type" not in result
-
-    def test_no_language_section_when_empty(self, minimal_metrics: MagicMock) -> None:
-        """Language section must not appear when there is no language data."""
-        result = MarkdownFormatter().format(minimal_metrics)
-        assert "Lines of Code by Language" not in result
-
-    def test_category_section_present(self, full_metrics: MagicMock) -> None:
-        """Category section must appear and contain category names."""
-        result = MarkdownFormatter().format(full_metrics)
-        assert "## Lines of Code by Type" in result
-        assert "Source" in result
-        assert "Test" in result
-        assert "Unknown" in result
-
-    def test_language_section_present(self, full_metrics: MagicMock) -> None:
-        """Language section must appear and list all languages."""
-        result = MarkdownFormatter().format(full_metrics)
-        assert "## Lines of Code by Language" in result
-        assert "Python" in result
-        assert "YAML" in result
-
-    def test_category_percentages(self, full_metrics: MagicMock) -> None:
-        """Category rows must include percentage values."""
-        result = MarkdownFormatter().format(full_metrics)
-        assert "70.0%" in result
-
-    def test_language_code_columns(self, full_metrics: MagicMock) -> None:
-        """Language table must expose the code/comments/blank breakdown."""
-        result = MarkdownFormatter().format(full_metrics)
-        assert "230" in result
-
-    def test_table_has_markdown_pipes(self, full_metrics: MagicMock) -> None:
-        """Tables must use the pipe character as column delimiter."""
-        result = MarkdownFormatter().format(full_metrics)
-        assert "|" in result
-
-    def test_zero_total_lines(self, zero_lines_metrics: MagicMock) -> None:
+        assert isinstance(minimal_markdown, str)
+
+    @pytest.mark.parametrize(
+        ("needle", "present"),
+        [
+            ("# Scan: my_project", True),
+            ("## Project Statistics", True),
+            ("/home/user/project", True),
+            ("2024-06-01", True),
+            ("42", True),
+            ("1.5 MB", True),
+            ("1,000", True),
+            ("Lines of Code by Type", False),
+            ("Lines of Code by Language", False),
+        ],
+    )
+    def test_minimal_output(
+        self, minimal_markdown: str, needle: str, present: bool
+    ) -> None:
+        """Minimal output has the heading and summary but no breakdown sections."""
+        assert (needle in minimal_markdown) is present
+
+    @pytest.mark.parametrize(
+        "needle",
+        [
+            "## Lines of Code by Type",
+            "Source",
+            "Test",
+            "Unknown",
+            "## Lines of Code by Language",
+            "Python",
+            "YAML",
+            "70.0%",  # source share of total lines
+            "230",  # Python code lines: 300 - 40 comments - 30 blank
+            "|",
+        ],
+    )
+    def test_full_output_contains(self, full_markdown: str, needle: str) -> None:
+        """Full output lists categories and languages with their breakdowns."""
+        assert needle in full_markdown
+
+    def test_zero_total_lines(self, zero_lines_metrics: Metrics) -> None:
         """Formatter must not raise when total_lines is zero."""
-        result = MarkdownFormatter().format(zero_lines_metrics)
+        result = _FORMATTER.format(zero_lines_metrics)
         assert "0.0%" in result
 
-    def test_sorted_by_line_count_descending(self, full_metrics: MagicMock) -> None:
+    def test_sorted_by_line_count_descending(self, full_markdown: str) -> None:
         """Both tables must list entries in descending line-count order."""
-        result = MarkdownFormatter().format(full_metrics)
-        python_pos = result.index("Python")
-        yaml_pos = result.index("YAML")
-        assert python_pos < yaml_pos  # Python (300) before YAML (200)
+        # Python (300) before YAML (200): search for YAML only after Python
+        python_pos = full_markdown.index("Python")
+        assert "YAML" not in full_markdown[:python_pos]
+        assert full_markdown.find("YAML", python_pos) != -1
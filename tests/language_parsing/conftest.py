@@ -0,0 +1,43 @@
+"""Shared fixtures for language parsing tests.
+
+LanguageDetector parses the bundled languages.yml on construction and is
+read-only afterwards, so one instance is shared across the session.
+LanguageAnalyzer only holds its config, so tests in a class share one.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from statsvy.language_parsing.language_analyzer import LanguageAnalyzer
+from statsvy.language_parsing.language_detector import LanguageDetector
+
+
+@pytest.fixture(scope="session")
+def languages_config_path() -> Path:
+    """Locates the bundled language configuration.
+
+    Returns:
+        Path: Path to assets/languages.yml in the repository.
+    """
+    return Path(__file__).parent.parent.parent / "assets" / "languages.yml"
+
+
+@pytest.fixture(scope="session")
+def real_detector(languages_config_path: Path) -> LanguageDetector:
+    """Creates a detector from the bundled language configuration.
+
+    Returns:
+        LanguageDetector: Detector loaded from assets/languages.yml.
+    """
+    return LanguageDetector(language_config_path=languages_config_path)
+
+
+@pytest.fixture(scope="class")
+def analyzer() -> LanguageAnalyzer:
+    """Creates an analyzer with the default configuration.
+
+    Returns:
+        LanguageAnalyzer: Analyzer shared by the tests of one class.
+    """
+    return LanguageAnalyzer()
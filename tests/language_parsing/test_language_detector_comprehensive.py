@@ -8,12 +8,12 @@ from statsvy.language_parsing.language_detector import LanguageDetector
 class TestLanguageDetectorComprehensive:
     """Comprehensive tests for LanguageDetector integration."""
 
-    def test_detector_with_real_language_config(self) -> None:
+    def test_detector_with_real_language_config(
+        self, real_detector: LanguageDetector
+    ) -> None:
         """Test detector with realistic language configuration."""
-        config_path = Path(__file__).parent.parent.parent / "assets" / "languages.yml"
-        detector = LanguageDetector(language_config_path=config_path)
-        assert detector.detect(Path("main.py")) == "Python"
-        assert detector.detect(Path("app.js")) == "JavaScript"
-        assert detector.detect(Path("script.mts")) == "TypeScript"
-        assert detector.detect(Path("Gemfile")) == "Ruby"
-        assert detector.detect(Path("Makefile")) == "Makefile"
+        assert real_detector.detect(Path("main.py")) == "Python"
+        assert real_detector.detect(Path("app.js")) == "JavaScript"
+        assert real_detector.detect(Path("script.mts")) == "TypeScript"
+        assert real_detector.detect(Path("Gemfile")) == "Ruby"
+        assert real_detector.detect(Path("Makefile")) == "Makefile"
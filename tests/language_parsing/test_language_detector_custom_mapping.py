@@ -8,16 +8,9 @@ from statsvy.language_parsing.language_detector import LanguageDetector
 class TestLanguageDetectorCustomMapping:
     """Tests for LanguageDetector custom mapping behavior."""
 
-    @staticmethod
-    def get_detector(custom_mapping: dict[str, object]) -> LanguageDetector:
-        """Create a detector with custom language mapping."""
-        config_path = Path(__file__).parent.parent.parent / "assets" / "languages.yml"
-        return LanguageDetector(
-            language_config_path=config_path,
-            custom_language_mapping=custom_mapping,
-        )
-
-    def test_custom_mapping_overrides_extension(self) -> None:
+    def test_custom_mapping_overrides_extension(
+        self, languages_config_path: Path
+    ) -> None:
         """Custom mappings should override existing extensions."""
         custom_mapping = {
             "Docs": {
@@ -25,10 +18,13 @@ class TestLanguageDetectorCustomMapping:
                 "extensions": [".md"],
             }
         }
-        detector = self.get_detector(custom_mapping)
+        detector = LanguageDetector(
+            language_config_path=languages_config_path,
+            custom_language_mapping=custom_mapping,
+        )
         assert detector.detect(Path("README.md")) == "Docs"
 
-    def test_custom_mapping_adds_filename(self) -> None:
+    def test_custom_mapping_adds_filename(self, languages_config_path: Path) -> None:
         """Custom mappings should support filename detection."""
         custom_mapping = {
             "BuildSpec": {
@@ -36,10 +32,13 @@ class TestLanguageDetectorCustomMapping:
                 "filenames": ["Buildfile"],
             }
         }
-        detector = self.get_detector(custom_mapping)
+        detector = LanguageDetector(
+            language_config_path=languages_config_path,
+            custom_language_mapping=custom_mapping,
+        )
         assert detector.detect(Path("Buildfile")) == "BuildSpec"
 
-    def test_custom_mapping_sets_category(self) -> None:
+    def test_custom_mapping_sets_category(self, languages_config_path: Path) -> None:
         """Custom mappings should provide category types."""
         custom_mapping = {
             "Infra": {
@@ -47,7 +46,10 @@ class TestLanguageDetectorCustomMapping:
                 "extensions": [".infra"],
             }
         }
-        detector = self.get_detector(custom_mapping)
+        detector = LanguageDetector(
+            language_config_path=languages_config_path,
+            custom_language_mapping=custom_mapping,
+        )
         lang = detector.detect(Path("main.infra"))
         assert lang == "Infra"
         assert detector.get_category(lang) == "data"
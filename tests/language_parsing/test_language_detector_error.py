@@ -1,6 +1,5 @@
 """Tests for LanguageDetector error handling."""
 
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -12,33 +11,27 @@ from statsvy.language_parsing.language_detector import LanguageDetector
 class TestLanguageDetectorErrorHandling:
     """Tests for LanguageDetector error handling."""
 
-    def test_detect_language_malformed_yaml(self) -> None:
+    def test_detect_language_malformed_yaml(self, tmp_path: Path) -> None:
         """Test that detector handles malformed YAML gracefully."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_file = Path(tmpdir) / "languages.yml"
-            with open(config_file, "w") as f:
-                f.write("invalid: yaml: content:")
-            with pytest.raises(ValueError, match="Failed to load language map"):
-                LanguageDetector(language_config_path=config_file)
-
-    def test_detect_language_empty_yaml(self) -> None:
+        config_file = tmp_path / "languages.yml"
+        config_file.write_text("invalid: yaml: content:")
+        with pytest.raises(ValueError, match="Failed to load language map"):
+            LanguageDetector(language_config_path=config_file)
+
+    def test_detect_language_empty_yaml(self, tmp_path: Path) -> None:
         """Test that detector handles empty YAML file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_file = Path(tmpdir) / "languages.yml"
-            with open(config_file, "w") as f:
-                f.write("")
-            detector = LanguageDetector(language_config_path=config_file)
-            result = detector.detect(Path("test.py"))
-            assert result == "unknown"
-
-    def test_detect_language_invalid_config_format(self) -> None:
+        config_file = tmp_path / "languages.yml"
+        config_file.write_text("")
+        detector = LanguageDetector(language_config_path=config_file)
+        result = detector.detect(Path("test.py"))
+        assert result == "unknown"
+
+    def test_detect_language_invalid_config_format(self, tmp_path: Path) -> None:
         """Test that detector handles invalid config format gracefully."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_file = Path(tmpdir) / "languages.yml"
-            config = {"languages": {"Python": {"extensions": [".py"]}}}
-            with open(config_file, "w") as f:
-                yaml.dump(config, f)
-            detector = LanguageDetector(language_config_path=config_file)
-            # Should not crash with unknown config format
-            result = detector.detect(Path("test.py"))
-            assert result == "unknown"
+        config_file = tmp_path / "languages.yml"
+        config = {"languages": {"Python": {"extensions": [".py"]}}}
+        config_file.write_text(yaml.dump(config))
+        detector = LanguageDetector(language_config_path=config_file)
+        # Should not crash with unknown config format
+        result = detector.detect(Path("test.py"))
+        assert result == "unknown"
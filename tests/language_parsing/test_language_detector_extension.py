@@ -2,52 +2,41 @@
 
 from pathlib import Path
 
+import pytest
+
 from statsvy.language_parsing.language_detector import LanguageDetector
 
 
 class TestLanguageDetectorExtensionDetection:
     """Tests for LanguageDetector extension-based detection."""
 
-    @staticmethod
-    def get_detector() -> LanguageDetector:
-        """Get detector with real language config."""
-        config_path = Path(__file__).parent.parent.parent / "assets" / "languages.yml"
-        return LanguageDetector(language_config_path=config_path)
-
-    def test_detect_language_python_file(self) -> None:
-        """Test detection of Python files."""
-        detector = self.get_detector()
-        assert detector.detect(Path("test.py")) == "Python"
-
-    def test_detect_language_javascript_file(self) -> None:
-        """Test detection of JavaScript files."""
-        detector = self.get_detector()
-        assert detector.detect(Path("script.js")) == "JavaScript"
-
-    def test_detect_language_multiple_extensions(self) -> None:
-        """Test detection with multiple extensions for same language."""
-        detector = self.get_detector()
-        assert detector.detect(Path("program.c")) == "C"
-        assert detector.detect(Path("header.h")) == "Objective-C"
-
-    def test_detect_language_case_insensitive(self) -> None:
-        """Test that extension detection is case-insensitive."""
-        detector = self.get_detector()
-        assert detector.detect(Path("test.PY")) == "Python"
-        assert detector.detect(Path("test.Py")) == "Python"
-
-    def test_detect_language_unknown_extension(self) -> None:
-        """Test detection of unknown extension returns unknown."""
-        detector = self.get_detector()
-        assert detector.detect(Path("test.unknown")) == "unknown"
-
-    def test_detect_language_no_extension(self) -> None:
-        """Test detection of file with no extension."""
-        detector = self.get_detector()
-        assert detector.detect(Path("Makefile")) == "Makefile"
-
-    def test_detect_language_dot_file(self) -> None:
-        """Test detection of dot file without extension."""
-        detector = self.get_detector()
-        result = detector.detect(Path(".gitignore"))
-        assert result == "Ignore List"
+    @pytest.mark.parametrize(
+        ("filename", "expected"),
+        [
+            ("test.py", "Python"),
+            ("script.js", "JavaScript"),
+            ("program.c", "C"),
+            ("header.h", "Objective-C"),
+            ("test.PY", "Python"),
+            ("test.Py", "Python"),
+            ("test.unknown", "unknown"),
+            ("Makefile", "Makefile"),
+            (".gitignore", "Ignore List"),
+        ],
+        ids=[
+            "python",
+            "javascript",
+            "c-source",
+            "c-header",
+            "upper-case-extension",
+            "mixed-case-extension",
+            "unknown-extension",
+            "no-extension",
+            "dot-file",
+        ],
+    )
+    def test_detect(
+        self, real_detector: LanguageDetector, filename: str, expected: str
+    ) -> None:
+        """Test detection by extension, case-insensitively, with fallbacks."""
+        assert real_detector.detect(Path(filename)) == expected
@@ -13,12 +13,10 @@ class TestLanguageDetectorInit:
         detector = LanguageDetector()
         assert detector is not None
 
-    def test_detector_with_real_config(self) -> None:
+    def test_detector_with_real_config(self, real_detector: LanguageDetector) -> None:
         """Test that LanguageDetector works with real config."""
-        config_path = Path(__file__).parent.parent.parent / "assets" / "languages.yml"
-        detector = LanguageDetector(language_config_path=config_path)
-        assert len(detector.extension_to_lang) > 0
-        assert len(detector.filename_to_lang) >= 0
+        assert len(real_detector.extension_to_lang) > 0
+        assert len(real_detector.filename_to_lang) >= 0
 
     def test_detector_with_nonexistent_config_file(self) -> None:
         """Test that LanguageDetector handles missing config gracefully."""
@@ -1,7 +1,9 @@
 """Tests for language analyzer and detector edge cases."""
 
 from pathlib import Path
+from typing import Any
 
+import pytest
 from pygments.lexers import PythonLexer
 
 from statsvy.language_parsing.language_analyzer import LanguageAnalyzer
@@ -11,10 +13,10 @@ from statsvy.language_parsing.language_detector import LanguageDetector
 class TestLanguageAnalyzerCoverage:
     """Test edge cases in language analyzer."""
 
-    def test_analyze_file_with_comments_and_blank_lines(self) -> None:
+    def test_analyze_file_with_comments_and_blank_lines(
+        self, analyzer: LanguageAnalyzer
+    ) -> None:
         """Test analyze method counts comments and blank lines."""
-        analyzer = LanguageAnalyzer()
-
         code = """# This is a comment
 def foo():
     # Another comment
@@ -28,35 +30,36 @@ def foo():
         assert isinstance(result, tuple)
         assert len(result) == 2
 
-    def test_count_blank_lines_with_empty_string(self) -> None:
+    def test_count_blank_lines_with_empty_string(
+        self, analyzer: LanguageAnalyzer
+    ) -> None:
         """Test _count_blank_lines with empty code."""
-        analyzer = LanguageAnalyzer()
-
         result = analyzer._count_blank_lines("")
 
         assert result == 0
 
-    def test_count_blank_lines_with_only_blanks(self) -> None:
+    def test_count_blank_lines_with_only_blanks(
+        self, analyzer: LanguageAnalyzer
+    ) -> None:
         """Test _count_blank_lines with only blank lines."""
-        analyzer = LanguageAnalyzer()
-
         result = analyzer._count_blank_lines("\n\n\n")
 
         assert result == 3
 
-    def test_count_blank_lines_with_whitespace_only_lines(self) -> None:
+    def test_count_blank_lines_with_whitespace_only_lines(
+        self, analyzer: LanguageAnalyzer
+    ) -> None:
         """Test _count_blank_lines counts whitespace-only lines."""
-        analyzer = LanguageAnalyzer()
-
         code = "  \n  \n  "
         result = analyzer._count_blank_lines(code)
 
         # Whitespace-only lines should be counted as blank
         assert result >= 2
 
-    def test_count_comment_lines_with_python_code(self) -> None:
+    def test_count_comment_lines_with_python_code(
+        self, analyzer: LanguageAnalyzer
+    ) -> None:
         """Test _count_comment_lines with python lexer."""
-        analyzer = LanguageAnalyzer()
         lexer = PythonLexer()
 
         # Test with no comments
@@ -120,76 +123,54 @@ class TestLanguageDetectorCoverage:
 
         assert result == "unknown"
 
-    def test_process_extensions_with_valid_extensions(self) -> None:
-        """Test _process_extensions with valid language extensions."""
-        detector = LanguageDetector()
-        extension_to_lang = {}
-
-        info = {"extensions": [".py", ".pyw"]}
-
-        detector._process_extensions(info, "python", extension_to_lang)
-
-        assert extension_to_lang.get(".py") == "python"
-        assert extension_to_lang.get(".pyw") == "python"
-
-    def test_process_extensions_with_no_extensions(self) -> None:
-        """Test _process_extensions with missing extensions key."""
-        detector = LanguageDetector()
-        extension_to_lang = {}
-
-        info = {}
-
-        # Should not raise
-        detector._process_extensions(info, "language", extension_to_lang)
-
-        assert len(extension_to_lang) == 0
-
-    def test_process_filenames_with_valid_filenames(self) -> None:
-        """Test _process_filenames with valid language filenames."""
-        detector = LanguageDetector()
-        filename_to_lang = {}
-
-        info = {"filenames": ["Makefile", "makefile"]}
-
-        detector._process_filenames(info, "makefile", filename_to_lang)
-
-        assert filename_to_lang.get("Makefile") == "makefile"
-        assert filename_to_lang.get("makefile") == "makefile"
-
-    def test_process_filenames_with_no_filenames(self) -> None:
-        """Test _process_filenames with missing filenames key."""
-        detector = LanguageDetector()
-        filename_to_lang = {}
-
-        info = {}
-
-        # Should not raise
-        detector._process_filenames(info, "language", filename_to_lang)
-
-        assert len(filename_to_lang) == 0
-
-    def test_process_category_with_valid_category(self) -> None:
-        """Test _process_category with valid language category."""
-        detector = LanguageDetector()
-        lang_to_category = {}
-
-        info = {"type": "compiled"}
-
-        detector._process_category(info, "golang", lang_to_category)
-
-        assert lang_to_category.get("golang") == "compiled"
-
-    def test_process_category_with_no_category(self) -> None:
-        """Test _process_category with missing category key defaults to unknown."""
-        detector = LanguageDetector()
-        lang_to_category = {}
-
-        info = {}
-
-        # Should not raise and should default to "unknown"
-        detector._process_category(info, "language", lang_to_category)
-
-        assert lang_to_category.get("language") == "unknown"
+    @pytest.mark.parametrize(
+        ("method", "info", "lang_name", "expected"),
+        [
+            (
+                "_process_extensions",
+                {"extensions": [".py", ".pyw"]},
+                "python",
+                {".py": "python", ".pyw": "python"},
+            ),
+            ("_process_extensions", {}, "language", {}),
+            (
+                "_process_filenames",
+                {"filenames": ["Makefile", "makefile"]},
+                "makefile",
+                {"Makefile": "makefile", "makefile": "makefile"},
+            ),
+            ("_process_filenames", {}, "language", {}),
+            (
+                "_process_category",
+                {"type": "compiled"},
+                "golang",
+                {"golang": "compiled"},
+            ),
+            ("_process_category", {}, "language", {"language": "unknown"}),
+        ],
+        ids=[
+            "extensions",
+            "no-extensions",
+            "filenames",
+            "no-filenames",
+            "category",
+            "no-category-defaults-to-unknown",
+        ],
+    )
+    def test_process_language_info(
+        self,
+        method: str,
+        info: dict[str, Any],
+        lang_name: str,
+        expected: dict[str, str],
+    ) -> None:
+        """Test the _process_* helpers fill their mapping from one definition."""
+        target: dict[str, str] = {}
+
+        # The helpers are static, so no detector instance is needed
+        getattr(LanguageDetector, method)(info, lang_name, target)
+
+        assert target == expected
 
     def test_detect_returns_string(self) -> None:
         """Test detect always returns a string."""
@@ -11,19 +11,41 @@ from statsvy.data.project_info import (
 )
 from statsvy.serializers.project_info_serializer import ProjectInfoSerializer
 
+# The data classes are frozen, so shared samples are built once at import
+_CLICK = Dependency("click", ">=8.0.0", "prod", "pyproject.toml")
+_PYTEST = Dependency("pytest", "^7.0", "dev", "pyproject.toml")
+
+_SAMPLE_DEP_INFO = DependencyInfo(
+    dependencies=(_CLICK, _PYTEST),
+    prod_count=1,
+    dev_count=1,
+    optional_count=0,
+    total_count=2,
+    sources=("pyproject.toml",),
+    conflicts=(),
+)
+
+_SAMPLE_PROJECT_FILE_INFO = ProjectFileInfo(
+    name="my-project",
+    dependencies=DependencyInfo(
+        dependencies=(_CLICK,),
+        prod_count=1,
+        dev_count=0,
+        optional_count=0,
+        total_count=1,
+        sources=("pyproject.toml",),
+        conflicts=(),
+    ),
+    source_files=("pyproject.toml",),
+)
+
 
 class TestProjectInfoSerializerDependency:
     """Tests for Dependency serialization/deserialization."""
 
     def test_serializes_dependency_with_all_fields(self) -> None:
         """Test serializing dependency with all fields."""
-        dep = Dependency(
-            name="click",
-            version=">=8.0.0",
-            category="prod",
-            source_file="pyproject.toml",
-        )
-        result = ProjectInfoSerializer.serialize_dependency(dep)
+        result = ProjectInfoSerializer.serialize_dependency(_CLICK)
 
         assert result["name"] == "click"
         assert result["version"] == ">=8.0.0"
@@ -32,13 +54,7 @@ class TestProjectInfoSerializerDependency:
 
     def test_serialized_dependency_keys(self) -> None:
         """Test that serialized dependency has expected keys."""
-        dep = Dependency(
-            name="click",
-            version=">=8.0.0",
-            category="prod",
-            source_file="pyproject.toml",
-        )
-        result = ProjectInfoSerializer.serialize_dependency(dep)
+        result = ProjectInfoSerializer.serialize_dependency(_CLICK)
 
         assert "name" in result
         assert "version" in result
@@ -72,37 +88,20 @@ class TestProjectInfoSerializerDependency:
 
     def test_roundtrip_dependency_serialization(self) -> None:
         """Test that dependency can be serialized and deserialized."""
-        original = Dependency(
-            name="click",
-            version=">=8.0.0",
-            category="prod",
-            source_file="pyproject.toml",
-        )
-        serialized = ProjectInfoSerializer.serialize_dependency(original)
+        serialized = ProjectInfoSerializer.serialize_dependency(_CLICK)
         deserialized = ProjectInfoSerializer.deserialize_dependency(serialized)
 
-        assert deserialized == original
+        assert deserialized == _CLICK
 
     def test_serializes_dev_dependency(self) -> None:
         """Test serializing dev dependency."""
-        dep = Dependency(
-            name="pytest",
-            version="^7.0",
-            category="dev",
-            source_file="pyproject.toml",
-        )
-        result = ProjectInfoSerializer.serialize_dependency(dep)
+        result = ProjectInfoSerializer.serialize_dependency(_PYTEST)
 
         assert result["category"] == "dev"
 
     def test_serializes_optional_dependency(self) -> None:
         """Test serializing optional dependency."""
-        dep = Dependency(
-            name="extra-lib",
-            version="^1.0",
-            category="optional",
-            source_file="pyproject.toml",
-        )
+        dep = Dependency("extra-lib", "^1.0", "optional", "pyproject.toml")
         result = ProjectInfoSerializer.serialize_dependency(dep)
 
         assert result["category"] == "optional"
@@ -111,25 +110,9 @@ class TestProjectInfoSerializerDependency:
 class TestProjectInfoSerializerDependencyInfo:
     """Tests for DependencyInfo serialization/deserialization."""
 
-    def _make_dep_info(self) -> DependencyInfo:
-        """Create sample DependencyInfo."""
-        deps = (
-            Dependency("click", ">=8.0.0", "prod", "pyproject.toml"),
-            Dependency("pytest", "^7.0", "dev", "pyproject.toml"),
-        )
-        return DependencyInfo(
-            dependencies=deps,
-            prod_count=1,
-            dev_count=1,
-            optional_count=0,
-            total_count=2,
-            sources=("pyproject.toml",),
-            conflicts=(),
-        )
-
     def test_serializes_dependency_info_with_all_fields(self) -> None:
         """Test serializing DependencyInfo with all fields."""
-        info = self._make_dep_info()
+        info = _SAMPLE_DEP_INFO
         result = ProjectInfoSerializer.serialize_dependency_info(info)
 
         assert result["total_count"] == 2
@@ -142,7 +125,7 @@ class TestProjectInfoSerializerDependencyInfo:
 
     def test_serialized_dependency_info_keys(self) -> None:
         """Test that serialized DependencyInfo has expected keys."""
-        info = self._make_dep_info()
+        info = _SAMPLE_DEP_INFO
         result = ProjectInfoSerializer.serialize_dependency_info(info)
 
         assert "total_count" in result
@@ -187,7 +170,7 @@ class TestProjectInfoSerializerDependencyInfo:
 
     def test_roundtrip_dependency_info_serialization(self) -> None:
         """Test that DependencyInfo can be serialized and deserialized."""
-        original = self._make_dep_info()
+        original = _SAMPLE_DEP_INFO
         serialized = ProjectInfoSerializer.serialize_dependency_info(original)
         deserialized = ProjectInfoSerializer.deserialize_dependency_info(serialized)
 
@@ -228,7 +211,7 @@ class TestProjectInfoSerializerDependencyInfo:
 
     def test_handles_conflicts_in_serialization(self) -> None:
         """Test serialization of DependencyInfo with conflicts."""
-        deps = (Dependency("click", ">=8.0.0", "prod", "pyproject.toml"),)
+        deps = (_CLICK,)
         info = DependencyInfo(
             dependencies=deps,
             prod_count=1,
@@ -246,27 +229,9 @@ class TestProjectInfoSerializerDependencyInfo:
 class TestProjectInfoSerializerProjectFileInfo:
     """Tests for ProjectFileInfo serialization/deserialization."""
 
-    def _make_project_file_info(self) -> ProjectFileInfo:
-        """Create sample ProjectFileInfo."""
-        deps = (Dependency("click", ">=8.0.0", "prod", "pyproject.toml"),)
-        dep_info = DependencyInfo(
-            dependencies=deps,
-            prod_count=1,
-            dev_count=0,
-            optional_count=0,
-            total_count=1,
-            sources=("pyproject.toml",),
-            conflicts=(),
-        )
-        return ProjectFileInfo(
-            name="my-project",
-            dependencies=dep_info,
-            source_files=("pyproject.toml",),
-        )
-
     def test_serializes_project_file_info_with_all_fields(self) -> None:
         """Test serializing ProjectFileInfo with all fields."""
-        info = self._make_project_file_info()
+        info = _SAMPLE_PROJECT_FILE_INFO
         result = ProjectInfoSerializer.serialize_project_file_info(info)
 
         assert result["name"] == "my-project"
@@ -275,7 +240,7 @@ class TestProjectInfoSerializerProjectFileInfo:
 
     def test_serialized_project_file_info_keys(self) -> None:
         """Test that serialized ProjectFileInfo has expected keys."""
-        info = self._make_project_file_info()
+        info = _SAMPLE_PROJECT_FILE_INFO
         result = ProjectInfoSerializer.serialize_project_file_info(info)
 
         assert "name" in result
@@ -312,7 +277,7 @@ class TestProjectInfoSerializerProjectFileInfo:
 
     def test_roundtrip_project_file_info_serialization(self) -> None:
         """Test that ProjectFileInfo can be serialized and deserialized."""
-        original = self._make_project_file_info()
+        original = _SAMPLE_PROJECT_FILE_INFO
         serialized = ProjectInfoSerializer.serialize_project_file_info(original)
         deserialized = ProjectInfoSerializer.deserialize_project_file_info(serialized)
 
@@ -378,9 +343,9 @@ class TestProjectInfoSerializerRoundtrips:
     def test_roundtrip_with_multiple_dependencies(self) -> None:
         """Test roundtrip with multiple dependencies."""
         deps = (
-            Dependency("click", ">=8.0.0", "prod", "pyproject.toml"),
+            _CLICK,
             Dependency("requests", "^2.0", "prod", "pyproject.toml"),
-            Dependency("pytest", "^7.0", "dev", "pyproject.toml"),
+            _PYTEST,
             Dependency("extra-lib", "^1.0", "optional", "pyproject.toml"),
         )
         dep_info = DependencyInfo(
@@ -405,7 +370,7 @@ class TestProjectInfoSerializerRoundtrips:
 
     def test_roundtrip_with_conflicts(self) -> None:
         """Test roundtrip with conflicts."""
-        deps = (Dependency("click", ">=8.0.0", "prod", "pyproject.toml"),)
+        deps = (_CLICK,)
         dep_info = DependencyInfo(
             dependencies=deps,
             prod_count=1,
@@ -447,9 +412,9 @@ class TestProjectInfoSerializerRoundtrips:
     def test_roundtrip_preserves_category_counts(self) -> None:
         """Test that roundtrip preserves category counts."""
         deps = (
-            Dependency("click", ">=8.0.0", "prod", "pyproject.toml"),
+            _CLICK,
             Dependency("requests", "^2.0", "prod", "pyproject.toml"),
-            Dependency("pytest", "^7.0", "dev", "pyproject.toml"),
+            _PYTEST,
         )
         dep_info = DependencyInfo(
             dependencies=deps,
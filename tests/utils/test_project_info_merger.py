@@ -5,6 +5,7 @@ objects and detects version conflicts between dependencies from different files.
 """
 
 from statsvy.data.project_info import (
+    EMPTY_PROJECT_FILE_INFO,
     Dependency,
     DependencyInfo,
     ProjectFileInfo,
@@ -22,6 +23,10 @@ class TestProjectInfoMergerEmptyInput:
         assert result.dependencies is None
         assert result.source_files == ()
 
+    def test_merge_empty_list_returns_shared_empty_info(self) -> None:
+        """Test that merging empty list reuses the shared empty result."""
+        assert ProjectInfoMerger.merge([]) is EMPTY_PROJECT_FILE_INFO
+
     def test_merge_single_info(self) -> None:
         """Test that single info is returned unchanged."""
         dep = Dependency("click", ">=8.0.0", "prod", "pyproject.toml")
@@ -239,6 +244,30 @@ class TestProjectInfoMergerConflictDetection:
         assert len(result.dependencies.conflicts) > 0
         assert "click" in result.dependencies.conflicts[0]
 
+    def test_conflict_message_lists_versions_per_file(self) -> None:
+        """Test the conflict description names each file and its versions."""
+        dep1 = Dependency("click", ">=8.0.0", "prod", "pyproject.toml")
+        dep2 = Dependency("click", ">=9.0.0", "prod", "requirements.txt")
+        dep3 = Dependency("click", "==9.1.0", "prod", "requirements.txt")
+
+        info1 = ProjectFileInfo(
+            name="project",
+            dependencies=self._make_dep_info([dep1]),
+            source_files=("pyproject.toml",),
+        )
+        info2 = ProjectFileInfo(
+            name=None,
+            dependencies=self._make_dep_info([dep2, dep3]),
+            source_files=("requirements.txt",),
+        )
+        result = ProjectInfoMerger.merge([info1, info2])
+
+        expected = (
+            "click: pyproject.toml has >=8.0.0; requirements.txt has ==9.1.0, >=9.0.0"
+        )
+        assert result.dependencies is not None
+        assert result.dependencies.conflicts == (expected,)
+
     def test_conflict_reported_for_same_dep_in_different_files(self) -> None:
         """Test that conflict is reported when same dep appears in multiple files."""
         dep1 = Dependency("click", ">=8.0.0", "prod", "pyproject.toml")